@@ -5,7 +5,7 @@ FastAPI router for blood request-related operations
 
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from models.blood_request import BloodRequest, BloodRequestCreate, BloodRequestUpdate
 from services.blood_request_service import BloodRequestService, BloodRequestServiceError
@@ -16,6 +16,9 @@ router = APIRouter(prefix="/api/requests", tags=["blood_requests"])
 # Initialize blood request service
 blood_request_service = BloodRequestService()
 
+# Blood requests per chunk written to an export stream
+_EXPORT_BATCH = 500
+
 
 @router.get("/", response_model=List[BloodRequest])
 async def get_blood_requests(
@@ -24,7 +27,8 @@ async def get_blood_requests(
     urgency: Optional[str] = Query(None, description="Filter by urgency (Low, Medium, High, Critical)"),
     status: Optional[str] = Query(None, description="Filter by status (Active, Fulfilled)"),
     limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum number of results (1-100)"),
-    offset: Optional[int] = Query(None, ge=0, description="Number of results to skip")
+    offset: Optional[int] = Query(None, ge=0, description="Number of results to skip"),
+    cursor: Optional[int] = Query(None, ge=1, description="ID of the last request on the previous page")
 ):
     """
     Get all blood requests with optional filtering.
@@ -35,6 +39,7 @@ async def get_blood_requests(
     - **status**: Filter by status (Active, Fulfilled)
     - **limit**: Maximum number of results to return (1-100)
     - **offset**: Number of results to skip for pagination
+    - **cursor**: ID of the last request on the previous page; faster than offset for deep pages
     """
     try:
         blood_requests = await blood_request_service.get_all_blood_requests(
@@ -43,7 +48,8 @@ async def get_blood_requests(
             urgency=urgency,
             status=status,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         return blood_requests
     except BloodRequestServiceError as e:
@@ -85,6 +91,100 @@ async def create_blood_request(request_data: BloodRequestCreate):
         )
 
 
+@router.get("/export")
+async def export_blood_requests(
+    blood_group: Optional[str] = Query(None, description="Filter by blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)"),
+    city: Optional[str] = Query(None, description="Filter by city"),
+    urgency: Optional[str] = Query(None, description="Filter by urgency (Low, Medium, High, Critical)"),
+    status_filter: Optional[str] = Query(None, alias="status", description="Filter by status (Active, Fulfilled)")
+):
+    """
+    Stream all matching blood requests as newline-delimited JSON.
+    
+    Requests are read and sent in batches, so memory use does not grow
+    with the number of requests.
+    
+    - **blood_group**: Filter by blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)
+    - **city**: Filter by city name
+    - **urgency**: Filter by urgency level (Low, Medium, High, Critical)
+    - **status**: Filter by status (Active, Fulfilled)
+    """
+    blood_requests = blood_request_service.iter_blood_requests(
+        blood_group=blood_group,
+        city=city,
+        urgency=urgency,
+        status=status_filter
+    )
+    
+    # Pull the first request up front so bad filters still get a 400
+    try:
+        first_request = await blood_requests.__anext__()
+    except StopAsyncIteration:
+        first_request = None
+    except BloodRequestServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    async def ndjson_lines():
+        if first_request is None:
+            return
+        lines = [first_request.model_dump_json()]
+        async for blood_request in blood_requests:
+            lines.append(blood_request.model_dump_json())
+            if len(lines) >= _EXPORT_BATCH:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+@router.post("/bulk/fulfill", response_model=List[int])
+async def bulk_fulfill_blood_requests(request_ids: List[int]):
+    """
+    Mark several blood requests as fulfilled in one request.
+    
+    Returns the IDs that were fulfilled; missing and already fulfilled
+    requests are skipped.
+    """
+    try:
+        return await blood_request_service.bulk_fulfill_blood_requests(request_ids)
+    except BloodRequestServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error occurred while fulfilling blood requests"
+        )
+
+
+@router.post("/bulk/delete", response_model=List[int])
+async def bulk_delete_blood_requests(request_ids: List[int]):
+    """
+    Delete several blood requests in one request.
+    
+    Returns the IDs that were deleted; missing requests are skipped.
+    """
+    try:
+        return await blood_request_service.bulk_delete_blood_requests(request_ids)
+    except BloodRequestServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error occurred while deleting blood requests"
+        )
+
+
 @router.get("/{request_id}", response_model=BloodRequest)
 async def get_blood_request(request_id: int):
     """
@@ -212,12 +312,18 @@ async def fulfill_blood_request(request_id: int):
 
 
 @router.get("/filter/active", response_model=List[BloodRequest])
-async def get_active_blood_requests():
+async def get_active_blood_requests(
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of results (default: all)"),
+    offset: int = Query(0, ge=0, description="Number of results to skip")
+):
     """
-    Get all active blood requests.
+    Get active blood requests, newest first.
+    
+    - **limit**: Maximum number of results to return (default: every active request)
+    - **offset**: Number of results to skip for pagination
     """
     try:
-        active_requests = await blood_request_service.get_active_blood_requests()
+        active_requests = await blood_request_service.get_active_blood_requests(limit, offset)
         return active_requests
     except BloodRequestServiceError as e:
         raise HTTPException(
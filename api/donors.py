@@ -5,7 +5,7 @@ FastAPI router for donor-related operations
 
 from typing import List, Optional
 from fastapi import APIRouter, HTTPException, Query, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from models.donor import Donor, DonorCreate, DonorUpdate
 from services.donor_service import DonorService, DonorServiceError
@@ -22,7 +22,8 @@ async def get_donors(
     blood_group: Optional[str] = Query(None, description="Filter by blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)"),
     city: Optional[str] = Query(None, description="Filter by city"),
     limit: Optional[int] = Query(None, ge=1, le=100, description="Maximum number of results (1-100)"),
-    offset: Optional[int] = Query(None, ge=0, description="Number of results to skip")
+    offset: Optional[int] = Query(None, ge=0, description="Number of results to skip"),
+    cursor: Optional[int] = Query(None, ge=1, description="ID of the last donor on the previous page")
 ):
     """
     Get all donors with optional filtering.
@@ -30,14 +31,16 @@ async def get_donors(
     - **blood_group**: Filter by blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)
     - **city**: Filter by city name
     - **limit**: Maximum number of results to return (1-100)
-    - **offset**: Number of results to skip for pagination
+    - **offset**: Number of results to skip for pagination (at most 10000; use cursor beyond that)
+    - **cursor**: ID of the last donor on the previous page; faster than offset for deep pages
     """
     try:
         donors = await donor_service.get_all_donors(
             blood_group=blood_group,
             city=city,
             limit=limit,
-            offset=offset
+            offset=offset,
+            cursor=cursor
         )
         return donors
     except DonorServiceError as e:
@@ -78,6 +81,66 @@ async def create_donor(donor_data: DonorCreate):
         )
 
 
+@router.post("/bulk", response_model=List[Donor], status_code=status.HTTP_201_CREATED)
+async def create_donors(donors_data: List[DonorCreate]):
+    """
+    Create several donors in one request.
+    
+    All donors are inserted in a single transaction; if any of them is
+    rejected, none are created.
+    """
+    try:
+        donors = await donor_service.create_donors(donors_data)
+        return donors
+    except DonorServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Internal server error occurred while creating donors"
+        )
+
+
+@router.get("/export")
+async def export_donors(
+    blood_group: Optional[str] = Query(None, description="Filter by blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)"),
+    city: Optional[str] = Query(None, description="Filter by city")
+):
+    """
+    Stream all matching donors as newline-delimited JSON.
+    
+    Donors are read and sent in chunks, so memory use does not grow with
+    the number of donors.
+    
+    - **blood_group**: Filter by blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)
+    - **city**: Filter by city name
+    """
+    chunks = donor_service.iter_donors(blood_group=blood_group, city=city)
+    
+    # Pull the first chunk up front so bad filters still get a 400
+    try:
+        first_chunk = await chunks.__anext__()
+    except StopAsyncIteration:
+        first_chunk = []
+    except DonorServiceError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    async def ndjson_lines():
+        if not first_chunk:
+            return
+        yield "".join(donor.model_dump_json() + "\n" for donor in first_chunk)
+        async for chunk in chunks:
+            yield "".join(donor.model_dump_json() + "\n" for donor in chunk)
+    
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/{donor_id}", response_model=Donor)
 async def get_donor(donor_id: int):
     """
@@ -13,6 +13,8 @@ DATABASE_FILE = "blood_donation.db"
 APP_NAME = "Blood Donation Management API"
 APP_VERSION = "1.0.0"
 DEBUG = os.getenv("DEBUG", "False").lower() == "true"
+# Set to "false" in production to disable /docs, /redoc and /openapi.json
+DOCS_ENABLED = os.getenv("DOCS_ENABLED", "True").lower() == "true"
 
 # Directory paths
 BASE_DIR = Path(__file__).parent
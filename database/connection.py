@@ -1,6 +1,9 @@
+import asyncio
+import atexit
 import sqlite3
 import aiosqlite
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional, Set
 import os
 import logging
 from contextlib import asynccontextmanager
@@ -13,6 +16,43 @@ logger = logging.getLogger(__name__)
 DATABASE_PATH = "blood_donation.db"
 TEST_DATABASE_PATH = "test_blood_donation.db"
 
+def _convert_timestamp(value: bytes) -> datetime:
+    """Parse a TIMESTAMP column stored as ISO text."""
+    return datetime.fromisoformat(value.decode())
+
+
+# Return TIMESTAMP columns as datetime objects straight from the driver
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+
+# Settings applied once to each shared connection
+POOL_PRAGMAS = [
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA foreign_keys = ON"
+]
+
+# Prepared statements kept per shared connection. Repository SQL comes from
+# module constants and small lru_cached builders, so this covers all of it
+STATEMENT_CACHE_SIZE = 256
+
+# Shared long-lived connections and their write locks, keyed by database path
+_pools: Dict[str, aiosqlite.Connection] = {}
+_write_locks: Dict[str, asyncio.Lock] = {}
+
+# Dedicated connections for multi-statement write transactions, keyed by
+# database path, so readers on the shared connection never see uncommitted rows
+_transaction_connections: Dict[str, aiosqlite.Connection] = {}
+
+# Writes between runs of PRAGMA optimize on a shared connection
+OPTIMIZE_EVERY = 1000
+
+_write_counts: Dict[str, int] = {}
+# Pending optimize tasks, referenced so they are not garbage collected
+_optimize_tasks: Set[asyncio.Task] = set()
+
 
 class DatabaseConnection:
     """Singleton class to manage database connections."""
@@ -29,7 +69,9 @@ class DatabaseConnection:
         """Establish database connection."""
         if self._connection is None:
             try:
-                self._connection = await aiosqlite.connect(database_path)
+                self._connection = await aiosqlite.connect(
+                    database_path, detect_types=sqlite3.PARSE_DECLTYPES
+                )
                 # Enable foreign key constraints
                 await self._connection.execute("PRAGMA foreign_keys = ON")
                 await self._connection.commit()
@@ -78,7 +120,10 @@ async def close_database_connection():
 @asynccontextmanager
 async def get_db_session(database_path: str = DATABASE_PATH):
     """
-    Context manager for database sessions.
+    Context manager for a short-lived database session.
+    
+    Opens a dedicated connection and closes it on exit. Meant for one-shot
+    work such as init_db.py; request handling should use get_pool instead.
     
     Args:
         database_path: Path to the SQLite database file
@@ -88,7 +133,7 @@ async def get_db_session(database_path: str = DATABASE_PATH):
     """
     connection = None
     try:
-        connection = await aiosqlite.connect(database_path)
+        connection = await aiosqlite.connect(database_path, detect_types=sqlite3.PARSE_DECLTYPES)
         # Enable foreign key constraints
         await connection.execute("PRAGMA foreign_keys = ON")
         yield connection
@@ -102,10 +147,194 @@ async def get_db_session(database_path: str = DATABASE_PATH):
             await connection.close()
 
 
+async def _open_shared_connection(database_path: str) -> aiosqlite.Connection:
+    """
+    Open and configure a long-lived autocommit connection.
+    
+    The connection's worker thread is a daemon, so a connection that is never
+    closed cannot keep the interpreter from exiting; _close_pools_at_exit
+    closes whatever is still open.
+    
+    Args:
+        database_path: Path to the SQLite database file
+        
+    Returns:
+        aiosqlite.Connection: Configured connection
+    """
+    connection = aiosqlite.connect(
+        database_path,
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        isolation_level=None,
+        cached_statements=STATEMENT_CACHE_SIZE
+    )
+    connection.daemon = True
+    await connection
+    try:
+        for pragma in POOL_PRAGMAS:
+            await connection.execute(pragma)
+    except Exception as e:
+        await connection.close()
+        logger.error(f"Failed to configure shared connection: {e}")
+        raise
+    return connection
+
+
+async def get_pool(database_path: str = DATABASE_PATH) -> aiosqlite.Connection:
+    """
+    Get the shared connection for a database file, opening it on first use.
+    
+    The connection runs in autocommit mode and is meant for reads and
+    single-statement writes; multi-statement writes go through
+    write_transaction() instead.
+    
+    Args:
+        database_path: Path to the SQLite database file
+        
+    Returns:
+        aiosqlite.Connection: Shared database connection
+    """
+    connection = _pools.get(database_path)
+    if connection is not None:
+        return connection
+    
+    connection = await _open_shared_connection(database_path)
+    
+    # Another caller may have opened one while we were connecting
+    existing = _pools.setdefault(database_path, connection)
+    if existing is not connection:
+        await connection.close()
+        return existing
+    
+    logger.info(f"Opened shared connection to database: {database_path}")
+    return connection
+
+
+@asynccontextmanager
+async def write_transaction(
+    database_path: str = DATABASE_PATH,
+    connection: Optional[aiosqlite.Connection] = None
+) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Run a multi-statement write in one transaction, holding the write lock.
+    
+    Unless a connection is given, the statements run on a dedicated
+    connection rather than the shared one, so concurrent readers only see
+    the rows once the transaction commits.
+    
+    Args:
+        database_path: Path to the SQLite database file
+        connection: Optional connection to use instead of the dedicated one
+        
+    Yields:
+        aiosqlite.Connection: Connection inside BEGIN IMMEDIATE; committed
+        on exit, rolled back if the block raises
+    """
+    async with get_write_lock(database_path):
+        if connection is None:
+            connection = _transaction_connections.get(database_path)
+            if connection is None:
+                connection = await _open_shared_connection(database_path)
+                _transaction_connections[database_path] = connection
+        
+        await connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            await connection.rollback()
+            raise
+        await connection.commit()
+        record_write(database_path)
+
+
+def get_write_lock(database_path: str = DATABASE_PATH) -> asyncio.Lock:
+    """
+    Get the lock serializing writes on the shared connection for a database.
+    
+    Args:
+        database_path: Path to the SQLite database file
+        
+    Returns:
+        asyncio.Lock: Write lock for database_path
+    """
+    lock = _write_locks.get(database_path)
+    if lock is None:
+        lock = _write_locks.setdefault(database_path, asyncio.Lock())
+    return lock
+
+
+def record_write(database_path: str = DATABASE_PATH):
+    """
+    Count one write statement against a database.
+    
+    After OPTIMIZE_EVERY writes a PRAGMA optimize is scheduled on the shared
+    connection so planner statistics keep up with the data. Call it after
+    each write made under the write lock.
+    
+    Args:
+        database_path: Path to the SQLite database file
+    """
+    count = _write_counts.get(database_path, 0) + 1
+    if count >= OPTIMIZE_EVERY:
+        count = 0
+        task = asyncio.get_running_loop().create_task(_optimize(database_path))
+        _optimize_tasks.add(task)
+        task.add_done_callback(_optimize_tasks.discard)
+    _write_counts[database_path] = count
+
+
+async def _optimize(database_path: str):
+    """Run PRAGMA optimize on an open connection for database_path."""
+    connection = _pools.get(database_path) or _transaction_connections.get(database_path)
+    if connection is None:
+        return
+    try:
+        async with get_write_lock(database_path):
+            await connection.execute("PRAGMA optimize")
+    except Exception as e:
+        logger.warning(f"PRAGMA optimize failed for {database_path}: {e}")
+
+
+async def close_pool():
+    """Close every shared connection opened by get_pool, optimizing each first."""
+    if _optimize_tasks:
+        await asyncio.gather(*_optimize_tasks, return_exceptions=True)
+    
+    while _transaction_connections:
+        _, connection = _transaction_connections.popitem()
+        await connection.close()
+    
+    while _pools:
+        database_path, connection = _pools.popitem()
+        try:
+            await connection.execute("PRAGMA optimize")
+        except Exception as e:
+            logger.warning(f"PRAGMA optimize failed for {database_path}: {e}")
+        await connection.close()
+        _write_locks.pop(database_path, None)
+        _write_counts.pop(database_path, None)
+        logger.info(f"Closed shared connection to database: {database_path}")
+
+
+@atexit.register
+def _close_pools_at_exit():
+    """Close connections still open at interpreter exit, e.g. from scripts."""
+    if not _pools and not _transaction_connections:
+        return
+    # Tasks belong to an event loop that is no longer running
+    _optimize_tasks.clear()
+    try:
+        asyncio.run(close_pool())
+    except Exception as e:
+        logger.warning(f"Failed to close shared connections at exit: {e}")
+
+
 async def init_database(database_path: str = DATABASE_PATH, force_recreate: bool = False):
     """
     Initialize the database by creating tables.
     
+    Safe to run on every startup: missing tables, columns and indexes are
+    added and existing data is kept unless force_recreate is set.
+    
     Args:
         database_path: Path to the SQLite database file
         force_recreate: If True, drop existing tables and recreate them
@@ -155,10 +384,9 @@ async def execute_query(query: str, params: tuple = (), database_path: str = DAT
     Returns:
         List of query results
     """
-    async with get_db_session(database_path) as connection:
-        cursor = await connection.execute(query, params)
-        results = await cursor.fetchall()
-        return results
+    connection = await get_pool(database_path)
+    cursor = await connection.execute(query, params)
+    return await cursor.fetchall()
 
 
 async def execute_insert(query: str, params: tuple = (), database_path: str = DATABASE_PATH) -> int:
@@ -173,9 +401,10 @@ async def execute_insert(query: str, params: tuple = (), database_path: str = DA
     Returns:
         Last inserted row ID
     """
-    async with get_db_session(database_path) as connection:
+    connection = await get_pool(database_path)
+    async with get_write_lock(database_path):
         cursor = await connection.execute(query, params)
-        await connection.commit()
+        record_write(database_path)
         return cursor.lastrowid
 
 
@@ -191,7 +420,8 @@ async def execute_update(query: str, params: tuple = (), database_path: str = DA
     Returns:
         Number of affected rows
     """
-    async with get_db_session(database_path) as connection:
+    connection = await get_pool(database_path)
+    async with get_write_lock(database_path):
         cursor = await connection.execute(query, params)
-        await connection.commit()
+        record_write(database_path)
         return cursor.rowcount
\ No newline at end of file
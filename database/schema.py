@@ -9,7 +9,7 @@ CREATE TABLE IF NOT EXISTS donors (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name VARCHAR(100) NOT NULL,
     blood_group VARCHAR(3) NOT NULL CHECK (blood_group IN ('A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-')),
-    city VARCHAR(100) NOT NULL,
+    city VARCHAR(100) NOT NULL COLLATE NOCASE,
     contact_number VARCHAR(15) NOT NULL,
     email VARCHAR(100),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
@@ -22,6 +22,7 @@ CREATE TABLE IF NOT EXISTS blood_requests (
     patient_name VARCHAR(100) NOT NULL,
     blood_group VARCHAR(3) NOT NULL CHECK (blood_group IN ('A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-')),
     city VARCHAR(100) NOT NULL,
+    city_lc VARCHAR(100),
     urgency VARCHAR(10) NOT NULL CHECK (urgency IN ('Low', 'Medium', 'High', 'Critical')),
     hospital_name VARCHAR(100),
     contact_number VARCHAR(15) NOT NULL,
@@ -30,11 +31,67 @@ CREATE TABLE IF NOT EXISTS blood_requests (
 );
 """
 
+# Per-blood-group donor totals, kept current by the triggers below
+CREATE_DONOR_COUNTS_TABLE = """
+CREATE TABLE IF NOT EXISTS donor_counts (
+    blood_group VARCHAR(3) PRIMARY KEY,
+    n INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+CREATE_DONOR_COUNTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS donors_count_ai AFTER INSERT ON donors
+    BEGIN
+        UPDATE donor_counts SET n = n + 1 WHERE blood_group = NEW.blood_group;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS donors_count_ad AFTER DELETE ON donors
+    BEGIN
+        UPDATE donor_counts SET n = n - 1 WHERE blood_group = OLD.blood_group;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS donors_count_au AFTER UPDATE OF blood_group ON donors
+    BEGIN
+        UPDATE donor_counts SET n = n - 1 WHERE blood_group = OLD.blood_group;
+        UPDATE donor_counts SET n = n + 1 WHERE blood_group = NEW.blood_group;
+    END;
+    """
+]
+
+# Seed one row per blood group and resync totals with the donors table
+SYNC_DONOR_COUNTS = [
+    """
+    INSERT OR IGNORE INTO donor_counts (blood_group, n)
+    VALUES ('A+', 0), ('A-', 0), ('B+', 0), ('B-', 0), ('AB+', 0), ('AB-', 0), ('O+', 0), ('O-', 0);
+    """,
+    """
+    UPDATE donor_counts
+    SET n = (SELECT COUNT(*) FROM donors WHERE donors.blood_group = donor_counts.blood_group);
+    """
+]
+
 # SQL statements for creating indexes
 CREATE_DONORS_INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_donors_blood_group ON donors(blood_group);",
     "CREATE INDEX IF NOT EXISTS idx_donors_city ON donors(city);",
-    "CREATE INDEX IF NOT EXISTS idx_donors_blood_group_city ON donors(blood_group, city);"
+    "CREATE INDEX IF NOT EXISTS idx_donors_blood_group_city ON donors(blood_group, city);",
+    # Case-insensitive indexes matching the city = ? COLLATE NOCASE lookups,
+    # ending in the listing order so searches need no separate sort
+    "CREATE INDEX IF NOT EXISTS idx_donors_city_created ON donors(city COLLATE NOCASE, created_at DESC, id DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_donors_bg_city_created ON donors(blood_group, city COLLATE NOCASE, created_at DESC, id DESC);",
+    # Superseded by the two indexes above
+    "DROP INDEX IF EXISTS idx_donors_city_nocase;",
+    "DROP INDEX IF EXISTS idx_donors_bg_city_nocase;",
+    "CREATE INDEX IF NOT EXISTS idx_donors_created_id ON donors(created_at DESC, id DESC);",
+    # Emails are not unique; remove the unique index added for the old upsert
+    "DROP INDEX IF EXISTS idx_donors_email;",
+    # Serves the duplicate contact number checks; contact numbers are not
+    # unique at the schema level, so drop the unique index that used to be here
+    "DROP INDEX IF EXISTS idx_donors_contact_number;",
+    "CREATE INDEX IF NOT EXISTS idx_donors_contact ON donors(contact_number);"
 ]
 
 CREATE_BLOOD_REQUESTS_INDEXES = [
@@ -42,11 +99,24 @@ CREATE_BLOOD_REQUESTS_INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_blood_requests_city ON blood_requests(city);",
     "CREATE INDEX IF NOT EXISTS idx_blood_requests_status ON blood_requests(status);",
     "CREATE INDEX IF NOT EXISTS idx_blood_requests_urgency ON blood_requests(urgency);",
-    "CREATE INDEX IF NOT EXISTS idx_blood_requests_blood_group_city ON blood_requests(blood_group, city);"
+    "CREATE INDEX IF NOT EXISTS idx_blood_requests_blood_group_city ON blood_requests(blood_group, city);",
+    "CREATE INDEX IF NOT EXISTS idx_req_lookup ON blood_requests(status, blood_group, city_lc, created_at DESC, id DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_req_created_id ON blood_requests(created_at DESC, id DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_req_status_urgency ON blood_requests(status, urgency, created_at DESC, id DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_active_created_id ON blood_requests(created_at DESC, id DESC) WHERE status = 'Active';",
+    # Superseded by idx_active_created_id, which also orders ties by id
+    "DROP INDEX IF EXISTS idx_active_recent;"
+]
+
+# Lower-cased copy of city so case-insensitive lookups can use an index
+ADD_BLOOD_REQUESTS_CITY_LC = [
+    "ALTER TABLE blood_requests ADD COLUMN city_lc VARCHAR(100);",
+    "UPDATE blood_requests SET city_lc = LOWER(city);"
 ]
 
 # SQL statements for dropping tables
 DROP_TABLES = [
+    "DROP TABLE IF EXISTS donor_counts;",
     "DROP TABLE IF EXISTS blood_requests;",
     "DROP TABLE IF EXISTS donors;"
 ]
@@ -64,10 +134,25 @@ async def create_tables(connection: aiosqlite.Connection):
         await connection.execute(CREATE_DONORS_TABLE)
         logger.info("Created donors table")
         
+        # Create donor_counts table and the triggers maintaining it
+        await connection.execute(CREATE_DONOR_COUNTS_TABLE)
+        for trigger_sql in CREATE_DONOR_COUNTS_TRIGGERS:
+            await connection.execute(trigger_sql)
+        for sync_sql in SYNC_DONOR_COUNTS:
+            await connection.execute(sync_sql)
+        logger.info("Created donor_counts table")
+        
         # Create blood_requests table
         await connection.execute(CREATE_BLOOD_REQUESTS_TABLE)
         logger.info("Created blood_requests table")
         
+        # Bring databases created before city_lc existed up to date
+        columns = await get_table_info(connection, "blood_requests")
+        if "city_lc" not in {column[1] for column in columns}:
+            for migration_sql in ADD_BLOOD_REQUESTS_CITY_LC:
+                await connection.execute(migration_sql)
+            logger.info("Added city_lc column to blood_requests table")
+        
         # Create indexes for donors table
         for index_sql in CREATE_DONORS_INDEXES:
             await connection.execute(index_sql)
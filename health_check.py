@@ -13,7 +13,7 @@ from pathlib import Path
 from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel
 
-from database.connection import get_database_connection
+from database.connection import get_database_connection, get_pool
 from logging_config import get_logger
 
 logger = get_logger("health_check")
@@ -69,40 +69,38 @@ async def check_database_health() -> Dict[str, Any]:
     try:
         start_time = time.time()
         
-        # Import the async context manager
-        from database.connection import get_db_session
+        # Test the shared database connection
+        conn = await get_pool()
         
-        # Test database connection
-        async with get_db_session() as conn:
-            # Test basic query
-            cursor = await conn.execute("SELECT 1")
+        # Test basic query
+        cursor = await conn.execute("SELECT 1")
+        result = await cursor.fetchone()
+        
+        # Check if tables exist
+        cursor = await conn.execute("""
+            SELECT name FROM sqlite_master 
+            WHERE type='table' AND name IN ('donors', 'blood_requests')
+        """)
+        tables_result = await cursor.fetchall()
+        tables = [row[0] for row in tables_result]
+        
+        # Get database file size
+        db_path = Path("blood_donation.db")
+        db_size = db_path.stat().st_size if db_path.exists() else 0
+        
+        # Get record counts
+        donor_count = 0
+        request_count = 0
+        
+        if "donors" in tables:
+            cursor = await conn.execute("SELECT COUNT(*) FROM donors")
+            result = await cursor.fetchone()
+            donor_count = result[0] if result else 0
+        
+        if "blood_requests" in tables:
+            cursor = await conn.execute("SELECT COUNT(*) FROM blood_requests")
             result = await cursor.fetchone()
-            
-            # Check if tables exist
-            cursor = await conn.execute("""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name IN ('donors', 'blood_requests')
-            """)
-            tables_result = await cursor.fetchall()
-            tables = [row[0] for row in tables_result]
-            
-            # Get database file size
-            db_path = Path("blood_donation.db")
-            db_size = db_path.stat().st_size if db_path.exists() else 0
-            
-            # Get record counts
-            donor_count = 0
-            request_count = 0
-            
-            if "donors" in tables:
-                cursor = await conn.execute("SELECT COUNT(*) FROM donors")
-                result = await cursor.fetchone()
-                donor_count = result[0] if result else 0
-            
-            if "blood_requests" in tables:
-                cursor = await conn.execute("SELECT COUNT(*) FROM blood_requests")
-                result = await cursor.fetchone()
-                request_count = result[0] if result else 0
+            request_count = result[0] if result else 0
         
         response_time = time.time() - start_time
         
@@ -22,6 +22,9 @@ from middleware import register_middleware
 # Import logging configuration
 from logging_config import setup_logging, get_logger
 
+from config import DOCS_ENABLED
+from database.connection import close_pool, init_database
+
 # Set up logging
 setup_logging()
 logger = get_logger("main")
@@ -56,8 +59,9 @@ app = FastAPI(
     For detailed examples and testing, visit the interactive documentation below.
     """,
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url="/docs" if DOCS_ENABLED else None,
+    redoc_url="/redoc" if DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if DOCS_ENABLED else None,
     contact={
         "name": "Blood Donation Management System",
         "email": "support@blooddonation.example.com",
@@ -88,6 +92,16 @@ app.include_router(blood_requests_router)
 app.include_router(matching_router)
 app.include_router(health_router)
 
+@app.on_event("startup")
+async def migrate_database():
+    """Bring an existing database up to the current schema before serving requests."""
+    await init_database()
+
+@app.on_event("shutdown")
+async def close_database_pool():
+    """Close the shared database connections on shutdown."""
+    await close_pool()
+
 # Mount static files
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -115,6 +129,11 @@ async def requests_page(request: Request):
     """Blood requests management page"""
     return templates.TemplateResponse("requests.html", {"request": request})
 
+# Build the OpenAPI schema once, after every route is registered, so the
+# first /docs or /openapi.json hit doesn't pay for walking all the models
+if DOCS_ENABLED:
+    app.openapi_schema = app.openapi()
+
 if __name__ == "__main__":
     import uvicorn
     logger.info("Starting Blood Donation Management API server")
@@ -4,7 +4,7 @@ Provides request/response logging, timing, and monitoring capabilities.
 """
 
 import time
-import uuid
+import secrets
 import logging
 from typing import Callable, Dict, Any
 from datetime import datetime
@@ -19,6 +19,70 @@ from logging_config import get_logger, RequestLoggingContext
 
 logger = get_logger("middleware")
 
+# Proxy headers checked for the originating client address
+_XFF = "x-forwarded-for"
+_XRI = "x-real-ip"
+
+# (epoch second, ISO string) for the most recently formatted second
+_ts_cache = (0, "")
+
+
+def _ts_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string, at second granularity.
+    
+    The formatted string is cached and reused for every call within the same
+    second; sub-second precision is left to the log formatter.
+    
+    Returns:
+        ISO 8601 timestamp string
+    """
+    global _ts_cache
+    now_s = int(time.time())
+    if _ts_cache[0] != now_s:
+        _ts_cache = (now_s, datetime.utcfromtimestamp(now_s).isoformat() + "Z")
+    return _ts_cache[1]
+
+
+def _get_client_ip(request: Request) -> str:
+    """
+    Get client IP address from request.
+    
+    Args:
+        request: FastAPI request object
+        
+    Returns:
+        Client IP address
+    """
+    # Check for forwarded headers (for reverse proxy setups)
+    forwarded_for = request.headers.get(_XFF)
+    if forwarded_for:
+        first, _, _ = forwarded_for.partition(",")
+        return first.strip()
+    
+    real_ip = request.headers.get(_XRI)
+    if real_ip:
+        return real_ip
+    
+    # Fall back to direct client IP
+    return _get_peer_ip(request)
+
+
+def _get_peer_ip(request: Request) -> str:
+    """
+    Get the address of the directly connected peer, ignoring proxy headers.
+    
+    Args:
+        request: FastAPI request object
+        
+    Returns:
+        Peer IP address
+    """
+    if request.client:
+        return request.client.host
+    
+    return "unknown"
+
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for logging HTTP requests and responses."""
@@ -59,8 +123,8 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         if request.url.path in self.exclude_paths:
             return await call_next(request)
         
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        # Generate unique request ID (16 hex chars is plenty for log correlation)
+        request_id = secrets.token_hex(8)
         
         # Add request ID to request state
         request.state.request_id = request_id
@@ -123,9 +187,9 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             "path": request.url.path,
             "query_params": dict(request.query_params),
             "headers": dict(request.headers),
-            "client_ip": self._get_client_ip(request),
+            "client_ip": _get_client_ip(request),
             "user_agent": request.headers.get("user-agent"),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _ts_iso()
         }
         
         # Log request body if enabled
@@ -170,7 +234,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             "status_code": response.status_code,
             "headers": dict(response.headers),
             "process_time": process_time,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _ts_iso()
         }
         
         # Log response body if enabled and it's a JSON response
@@ -196,31 +260,6 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             f"Outgoing response: {request.method} {request.url.path} - {response.status_code}",
             extra=response_info
         )
-    
-    def _get_client_ip(self, request: Request) -> str:
-        """
-        Get client IP address from request.
-        
-        Args:
-            request: FastAPI request object
-            
-        Returns:
-            Client IP address
-        """
-        # Check for forwarded headers (for reverse proxy setups)
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            return forwarded_for.split(",")[0].strip()
-        
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-        
-        # Fall back to direct client IP
-        if request.client:
-            return request.client.host
-        
-        return "unknown"
 
 
 class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
@@ -275,7 +314,7 @@ class PerformanceMonitoringMiddleware(BaseHTTPMiddleware):
             "path": request.url.path,
             "status_code": response.status_code,
             "process_time": process_time,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": _ts_iso()
         }
         
         # Add request ID if available
@@ -330,26 +369,12 @@ class HealthCheckMiddleware(BaseHTTPMiddleware):
                 f"Health check request: {response.status_code}",
                 extra={
                     "status_code": response.status_code,
-                    "client_ip": self._get_client_ip(request),
-                    "timestamp": datetime.utcnow().isoformat()
+                    "client_ip": _get_peer_ip(request),
+                    "timestamp": _ts_iso()
                 }
             )
         
         return response
-    
-    def _get_client_ip(self, request: Request) -> str:
-        """
-        Get client IP address from request.
-        
-        Args:
-            request: FastAPI request object
-            
-        Returns:
-            Client IP address
-        """
-        if request.client:
-            return request.client.host
-        return "unknown"
 
 
 def register_middleware(app) -> None:
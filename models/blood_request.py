@@ -1,81 +1,86 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, validator
+from functools import lru_cache
+from typing import Any, Literal, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer, field_validator
 import re
 
+from .donor import BloodGroup, _NAME_PATTERN, _check_phone, serialize_datetime
+
+# Membership is checked by pydantic-core; no Python validator needed
+Urgency = Literal['Low', 'Medium', 'High', 'Critical']
+RequestStatus = Literal['Active', 'Fulfilled']
+
+# Letters, spaces, numbers, and common punctuation for hospital names
+_HOSPITAL_NAME_PATTERN = re.compile(r'[a-zA-Z0-9\s\.\-&,]+')
+
+
+@lru_cache(maxsize=4096)
+def _check_name(v: str) -> str:
+    """Check a patient name and return it stripped."""
+    v = v.strip()
+    if not _NAME_PATTERN.fullmatch(v):
+        raise ValueError('Patient name must contain only letters and spaces')
+    return v
+
+
+@lru_cache(maxsize=4096)
+def _check_hospital_name(v: str) -> str:
+    """Check a non-blank hospital name and return it stripped."""
+    v = v.strip()
+    if not _HOSPITAL_NAME_PATTERN.fullmatch(v):
+        raise ValueError('Hospital name contains invalid characters')
+    return v
+
 
 class BloodRequest(BaseModel):
     """Pydantic model for blood request information."""
     
     id: Optional[int] = None
     patient_name: str = Field(..., min_length=1, max_length=100, description="Name of the patient")
-    blood_group: str = Field(..., description="Required blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)")
+    blood_group: BloodGroup = Field(..., description="Required blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)")
     city: str = Field(..., min_length=1, max_length=100, description="City where blood is needed")
-    urgency: str = Field(..., description="Urgency level (Low, Medium, High, Critical)")
+    urgency: Urgency = Field(..., description="Urgency level (Low, Medium, High, Critical)")
     hospital_name: Optional[str] = Field(None, max_length=100, description="Hospital name (optional)")
     contact_number: str = Field(..., description="Contact phone number")
-    status: str = Field(default="Active", description="Request status (Active, Fulfilled)")
+    status: RequestStatus = Field(default="Active", description="Request status (Active, Fulfilled)")
     created_at: Optional[datetime] = Field(None, description="Timestamp when request was created")
     
-    @validator('blood_group')
-    def validate_blood_group(cls, v):
-        """Validate blood group format."""
-        valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-        if v not in valid_blood_groups:
-            raise ValueError(f'Invalid blood group. Must be one of: {", ".join(valid_blood_groups)}')
-        return v
-    
-    @validator('urgency')
-    def validate_urgency(cls, v):
-        """Validate urgency level."""
-        valid_urgency_levels = {'Low', 'Medium', 'High', 'Critical'}
-        if v not in valid_urgency_levels:
-            raise ValueError(f'Invalid urgency level. Must be one of: {", ".join(valid_urgency_levels)}')
-        return v
-    
-    @validator('status')
-    def validate_status(cls, v):
-        """Validate request status."""
-        valid_statuses = {'Active', 'Fulfilled'}
-        if v not in valid_statuses:
-            raise ValueError(f'Invalid status. Must be one of: {", ".join(valid_statuses)}')
-        return v
-    
-    @validator('contact_number')
+    @field_validator('contact_number')
+    @classmethod
     def validate_contact_number(cls, v):
         """Validate contact number format."""
-        # Remove spaces and dashes for validation
-        cleaned_number = re.sub(r'[\s\-\(\)]', '', v)
-        
-        # Check if it contains only digits and is between 10-15 characters
-        if not re.match(r'^\d{10,15}$', cleaned_number):
-            raise ValueError('Contact number must contain 10-15 digits')
-        
-        return v
+        return _check_phone(v)
     
-    @validator('patient_name')
+    @field_validator('patient_name')
+    @classmethod
     def validate_patient_name(cls, v):
         """Validate patient name contains only letters and spaces."""
-        if not re.match(r'^[a-zA-Z\s]+$', v.strip()):
-            raise ValueError('Patient name must contain only letters and spaces')
-        return v.strip()
+        return _check_name(v)
     
-    @validator('hospital_name')
+    @field_validator('hospital_name')
+    @classmethod
     def validate_hospital_name(cls, v):
         """Validate hospital name if provided."""
         if v is not None and v.strip():
-            # Allow letters, spaces, numbers, and common punctuation for hospital names
-            if not re.match(r'^[a-zA-Z0-9\s\.\-&,]+$', v.strip()):
-                raise ValueError('Hospital name contains invalid characters')
-            return v.strip()
+            return _check_hospital_name(v)
         return v
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-        json_schema_extra = {
+    # Lowercased city, set once when the model is built
+    _city_key: str = PrivateAttr(default='')
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Lowercase the city once for the matching comparisons."""
+        self._city_key = self.city.lower()
+    
+    @property
+    def city_key(self) -> str:
+        """Lowercased city for case-insensitive comparisons."""
+        return self._city_key
+    
+    _created_at = field_serializer('created_at', when_used='json')(serialize_datetime)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "patient_name": "Jane Smith",
                 "blood_group": "B+",
@@ -85,51 +90,34 @@ class BloodRequest(BaseModel):
                 "contact_number": "9876543210"
             }
         }
+    )
 
 
 class BloodRequestCreate(BaseModel):
     """Model for creating a new blood request (without id, status, and created_at)."""
     
     patient_name: str = Field(..., min_length=1, max_length=100)
-    blood_group: str
+    blood_group: BloodGroup
     city: str = Field(..., min_length=1, max_length=100)
-    urgency: str
+    urgency: Urgency
     hospital_name: Optional[str] = Field(None, max_length=100)
     contact_number: str
     
-    @validator('blood_group')
-    def validate_blood_group(cls, v):
-        valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-        if v not in valid_blood_groups:
-            raise ValueError(f'Invalid blood group. Must be one of: {", ".join(valid_blood_groups)}')
-        return v
-    
-    @validator('urgency')
-    def validate_urgency(cls, v):
-        valid_urgency_levels = {'Low', 'Medium', 'High', 'Critical'}
-        if v not in valid_urgency_levels:
-            raise ValueError(f'Invalid urgency level. Must be one of: {", ".join(valid_urgency_levels)}')
-        return v
-    
-    @validator('contact_number')
+    @field_validator('contact_number')
+    @classmethod
     def validate_contact_number(cls, v):
-        cleaned_number = re.sub(r'[\s\-\(\)]', '', v)
-        if not re.match(r'^\d{10,15}$', cleaned_number):
-            raise ValueError('Contact number must contain 10-15 digits')
-        return v
+        return _check_phone(v)
     
-    @validator('patient_name')
+    @field_validator('patient_name')
+    @classmethod
     def validate_patient_name(cls, v):
-        if not re.match(r'^[a-zA-Z\s]+$', v.strip()):
-            raise ValueError('Patient name must contain only letters and spaces')
-        return v.strip()
+        return _check_name(v)
     
-    @validator('hospital_name')
+    @field_validator('hospital_name')
+    @classmethod
     def validate_hospital_name(cls, v):
         if v is not None and v.strip():
-            if not re.match(r'^[a-zA-Z0-9\s\.\-&,]+$', v.strip()):
-                raise ValueError('Hospital name contains invalid characters')
-            return v.strip()
+            return _check_hospital_name(v)
         return v
 
 
@@ -137,57 +125,30 @@ class BloodRequestUpdate(BaseModel):
     """Model for updating blood request information (all fields optional)."""
     
     patient_name: Optional[str] = Field(None, min_length=1, max_length=100)
-    blood_group: Optional[str] = None
+    blood_group: Optional[BloodGroup] = None
     city: Optional[str] = Field(None, min_length=1, max_length=100)
-    urgency: Optional[str] = None
+    urgency: Optional[Urgency] = None
     hospital_name: Optional[str] = Field(None, max_length=100)
     contact_number: Optional[str] = None
-    status: Optional[str] = None
-    
-    @validator('blood_group')
-    def validate_blood_group(cls, v):
-        if v is not None:
-            valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-            if v not in valid_blood_groups:
-                raise ValueError(f'Invalid blood group. Must be one of: {", ".join(valid_blood_groups)}')
-        return v
-    
-    @validator('urgency')
-    def validate_urgency(cls, v):
-        if v is not None:
-            valid_urgency_levels = {'Low', 'Medium', 'High', 'Critical'}
-            if v not in valid_urgency_levels:
-                raise ValueError(f'Invalid urgency level. Must be one of: {", ".join(valid_urgency_levels)}')
-        return v
-    
-    @validator('status')
-    def validate_status(cls, v):
-        if v is not None:
-            valid_statuses = {'Active', 'Fulfilled'}
-            if v not in valid_statuses:
-                raise ValueError(f'Invalid status. Must be one of: {", ".join(valid_statuses)}')
-        return v
+    status: Optional[RequestStatus] = None
     
-    @validator('contact_number')
+    @field_validator('contact_number')
+    @classmethod
     def validate_contact_number(cls, v):
         if v is not None:
-            cleaned_number = re.sub(r'[\s\-\(\)]', '', v)
-            if not re.match(r'^\d{10,15}$', cleaned_number):
-                raise ValueError('Contact number must contain 10-15 digits')
+            return _check_phone(v)
         return v
     
-    @validator('patient_name')
+    @field_validator('patient_name')
+    @classmethod
     def validate_patient_name(cls, v):
         if v is not None:
-            if not re.match(r'^[a-zA-Z\s]+$', v.strip()):
-                raise ValueError('Patient name must contain only letters and spaces')
-            return v.strip()
+            return _check_name(v)
         return v
     
-    @validator('hospital_name')
+    @field_validator('hospital_name')
+    @classmethod
     def validate_hospital_name(cls, v):
         if v is not None and v.strip():
-            if not re.match(r'^[a-zA-Z0-9\s\.\-&,]+$', v.strip()):
-                raise ValueError('Hospital name contains invalid characters')
-            return v.strip()
+            return _check_hospital_name(v)
         return v
\ No newline at end of file
@@ -1,53 +1,97 @@
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, validator, EmailStr
+from functools import lru_cache
+from typing import Any, List, Literal, Optional
+from typing_extensions import Annotated
+from pydantic import (
+    AfterValidator, BaseModel, ConfigDict, Field, EmailStr, PrivateAttr, StringConstraints,
+    TypeAdapter, field_serializer, field_validator
+)
 import re
 
 
+# Separators ignored when validating contact numbers: every character \s
+# matches (Unicode whitespace, all at or below U+3000), dashes and parentheses
+_WHITESPACE = ''.join(c for c in map(chr, range(0x3001)) if c.isspace())
+_STRIP_TBL = str.maketrans('', '', _WHITESPACE + '-()')
+
+# Letters and whitespace only; matched against the stripped name
+_NAME_PATTERN = re.compile(r'[a-zA-Z\s]+')
+
+# Membership is checked by pydantic-core; no Python validator needed
+BloodGroup = Literal['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
+
+
+@lru_cache(maxsize=4096)
+def _check_phone(v: str) -> str:
+    """Check a contact number; results are cached since inputs repeat often."""
+    # Remove spaces, dashes and parentheses for validation
+    cleaned_number = v.translate(_STRIP_TBL)
+    
+    # Check if it contains only digits and is between 10-15 characters
+    if not (10 <= len(cleaned_number) <= 15 and cleaned_number.isdecimal()):
+        raise ValueError('Contact number must contain 10-15 digits')
+    return v
+
+
+def _validate_phone(v):
+    """Validate contact number format."""
+    if v is not None:
+        _check_phone(v)
+    return v
+
+
+@lru_cache(maxsize=4096)
+def _check_name(v: str) -> str:
+    """Check a donor name and return it stripped."""
+    v = v.strip()
+    if not _NAME_PATTERN.fullmatch(v):
+        raise ValueError('Name must contain only letters and spaces')
+    return v
+
+
+# Names are length-checked by pydantic-core, then stripped and checked
+# for letters and spaces only
+DonorName = Annotated[
+    str,
+    StringConstraints(min_length=1, max_length=100),
+    AfterValidator(_check_name)
+]
+
+
+def serialize_datetime(v: Optional[datetime]) -> Optional[str]:
+    """Serialize a timestamp as an ISO 8601 string."""
+    return v.isoformat() if v else None
+
+
 class Donor(BaseModel):
     """Pydantic model for blood donor information."""
     
     id: Optional[int] = None
-    name: str = Field(..., min_length=1, max_length=100, description="Full name of the donor")
-    blood_group: str = Field(..., description="Blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)")
+    name: DonorName = Field(..., description="Full name of the donor")
+    blood_group: BloodGroup = Field(..., description="Blood group (A+, A-, B+, B-, AB+, AB-, O+, O-)")
     city: str = Field(..., min_length=1, max_length=100, description="City where donor is located")
     contact_number: str = Field(..., description="Contact phone number")
     email: Optional[EmailStr] = Field(None, description="Email address (optional)")
     created_at: Optional[datetime] = Field(None, description="Timestamp when donor was registered")
     
-    @validator('blood_group')
-    def validate_blood_group(cls, v):
-        """Validate blood group format."""
-        valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-        if v not in valid_blood_groups:
-            raise ValueError(f'Invalid blood group. Must be one of: {", ".join(valid_blood_groups)}')
-        return v
+    _phone = field_validator('contact_number')(_validate_phone)
     
-    @validator('contact_number')
-    def validate_contact_number(cls, v):
-        """Validate contact number format."""
-        # Remove spaces and dashes for validation
-        cleaned_number = re.sub(r'[\s\-\(\)]', '', v)
-        
-        # Check if it contains only digits and is between 10-15 characters
-        if not re.match(r'^\d{10,15}$', cleaned_number):
-            raise ValueError('Contact number must contain 10-15 digits')
-        
-        return v
+    # Lowercased city, set once when the model is built
+    _city_key: str = PrivateAttr(default='')
     
-    @validator('name')
-    def validate_name(cls, v):
-        """Validate name contains only letters and spaces."""
-        if not re.match(r'^[a-zA-Z\s]+$', v.strip()):
-            raise ValueError('Name must contain only letters and spaces')
-        return v.strip()
+    def model_post_init(self, __context: Any) -> None:
+        """Lowercase the city once for the matching comparisons."""
+        self._city_key = self.city.lower()
     
-    class Config:
-        """Pydantic configuration."""
-        json_encoders = {
-            datetime: lambda v: v.isoformat() if v else None
-        }
-        json_schema_extra = {
+    @property
+    def city_key(self) -> str:
+        """Lowercased city for case-insensitive comparisons."""
+        return self._city_key
+    
+    _created_at = field_serializer('created_at', when_used='json')(serialize_datetime)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "name": "John Doe",
                 "blood_group": "O+",
@@ -56,67 +100,32 @@ class Donor(BaseModel):
                 "email": "john.doe@example.com"
             }
         }
+    )
 
 
 class DonorCreate(BaseModel):
     """Model for creating a new donor (without id and created_at)."""
     
-    name: str = Field(..., min_length=1, max_length=100)
-    blood_group: str
+    name: DonorName
+    blood_group: BloodGroup
     city: str = Field(..., min_length=1, max_length=100)
     contact_number: str
     email: Optional[EmailStr] = None
     
-    @validator('blood_group')
-    def validate_blood_group(cls, v):
-        valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-        if v not in valid_blood_groups:
-            raise ValueError(f'Invalid blood group. Must be one of: {", ".join(valid_blood_groups)}')
-        return v
-    
-    @validator('contact_number')
-    def validate_contact_number(cls, v):
-        cleaned_number = re.sub(r'[\s\-\(\)]', '', v)
-        if not re.match(r'^\d{10,15}$', cleaned_number):
-            raise ValueError('Contact number must contain 10-15 digits')
-        return v
-    
-    @validator('name')
-    def validate_name(cls, v):
-        if not re.match(r'^[a-zA-Z\s]+$', v.strip()):
-            raise ValueError('Name must contain only letters and spaces')
-        return v.strip()
+    _phone = field_validator('contact_number')(_validate_phone)
+
+
+# Validates a whole batch of donor payloads (e.g. a bulk import) in one call
+DonorCreateList = TypeAdapter(List[DonorCreate])
 
 
 class DonorUpdate(BaseModel):
     """Model for updating donor information (all fields optional)."""
     
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    blood_group: Optional[str] = None
+    name: Optional[DonorName] = None
+    blood_group: Optional[BloodGroup] = None
     city: Optional[str] = Field(None, min_length=1, max_length=100)
     contact_number: Optional[str] = None
     email: Optional[EmailStr] = None
     
-    @validator('blood_group')
-    def validate_blood_group(cls, v):
-        if v is not None:
-            valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-            if v not in valid_blood_groups:
-                raise ValueError(f'Invalid blood group. Must be one of: {", ".join(valid_blood_groups)}')
-        return v
-    
-    @validator('contact_number')
-    def validate_contact_number(cls, v):
-        if v is not None:
-            cleaned_number = re.sub(r'[\s\-\(\)]', '', v)
-            if not re.match(r'^\d{10,15}$', cleaned_number):
-                raise ValueError('Contact number must contain 10-15 digits')
-        return v
-    
-    @validator('name')
-    def validate_name(cls, v):
-        if v is not None:
-            if not re.match(r'^[a-zA-Z\s]+$', v.strip()):
-                raise ValueError('Name must contain only letters and spaces')
-            return v.strip()
-        return v
\ No newline at end of file
+    _phone = field_validator('contact_number')(_validate_phone)
\ No newline at end of file
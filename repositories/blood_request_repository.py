@@ -1,13 +1,169 @@
-from typing import List, Optional, Dict, Any
+import asyncio
+import json
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Dict, Any, Sequence, Tuple
 import logging
 from datetime import datetime
 import aiosqlite
 
 from models.blood_request import BloodRequest, BloodRequestCreate, BloodRequestUpdate
-from database.connection import get_db_session
+from database.connection import get_pool, get_write_lock, record_write, write_transaction
 
 logger = logging.getLogger(__name__)
 
+# Filter keys accepted by get_all/count_requests and their SQL conditions
+_FILTER_COLS = {
+    'blood_group': "blood_group = ?",
+    'city': "city_lc = ?",
+    'urgency': "urgency = ?",
+    'status': "status = ?",
+}
+
+# Bits for limit/offset/cursor, after one bit per filter key
+_LIMIT_BIT = 1 << len(_FILTER_COLS)
+_OFFSET_BIT = _LIMIT_BIT << 1
+_CURSOR_BIT = _OFFSET_BIT << 1
+
+# Keyset condition for the rows that follow the request with the given id
+# in newest-first order; binds that id twice
+_CURSOR_SQL = (
+    "(created_at, id) < ((SELECT created_at FROM blood_requests WHERE id = ?), ?)"
+)
+
+_SELECT_COLUMNS = """
+SELECT id, patient_name, blood_group, city, urgency, hospital_name,
+       contact_number, status, created_at{total}
+FROM blood_requests"""
+
+
+# Rows fetched per round trip to the database thread when streaming
+_FETCH_BATCH = 500
+
+# Marks an active request fulfilled; matches nothing if already fulfilled
+_SQL_FULFILL = """
+UPDATE blood_requests
+SET status = 'Fulfilled'
+WHERE id = ? AND status != 'Fulfilled'
+RETURNING id, patient_name, blood_group, city, urgency, hospital_name,
+          contact_number, status, created_at"""
+
+# Bulk variants take every id as one JSON array parameter, so a single
+# cached statement serves any number of ids
+_SQL_BULK_FULFILL = """
+UPDATE blood_requests
+SET status = 'Fulfilled'
+WHERE id IN (SELECT value FROM json_each(?)) AND status != 'Fulfilled'
+RETURNING id"""
+_SQL_BULK_DELETE = """
+DELETE FROM blood_requests
+WHERE id IN (SELECT value FROM json_each(?))
+RETURNING id"""
+
+# Columns whose value distribution get_distribution_stats reports
+_DISTRIBUTION_COLS = ('status', 'urgency', 'blood_group', 'city')
+
+
+def _where_sql(keymask: int) -> str:
+    """Return the WHERE clause for the filter and cursor bits set in keymask."""
+    conditions = [
+        condition
+        for bit, condition in enumerate(_FILTER_COLS.values())
+        if keymask & (1 << bit)
+    ]
+    if keymask & _CURSOR_BIT:
+        conditions.append(_CURSOR_SQL)
+    if not conditions:
+        return ""
+    return " WHERE " + " AND ".join(conditions)
+
+
+@lru_cache(maxsize=128)
+def _gen_select(keymask: int, with_total: bool = False) -> str:
+    """
+    Generate the SELECT for one combination of filters and pagination.
+    
+    Args:
+        keymask: Bit mask of filter keys present plus _LIMIT_BIT/_OFFSET_BIT/_CURSOR_BIT
+        with_total: Whether to add a COUNT(*) OVER () column
+        
+    Returns:
+        SQL string whose parameters follow the order of _FILTER_COLS,
+        then the cursor id (twice), then limit, then offset
+    """
+    query = _SELECT_COLUMNS.format(total=", COUNT(*) OVER () AS total" if with_total else "")
+    query += _where_sql(keymask) + " ORDER BY created_at DESC, id DESC"
+    if keymask & _LIMIT_BIT:
+        query += " LIMIT ?"
+        if keymask & _OFFSET_BIT:
+            query += " OFFSET ?"
+    return query
+
+
+@lru_cache(maxsize=32)
+def _gen_matching_select(group_count: int, has_city: bool, active_only: bool) -> str:
+    """
+    Generate the SELECT for requests in any of group_count blood groups.
+    
+    Args:
+        group_count: Number of blood group placeholders in the IN list
+        has_city: Whether to add a city condition
+        active_only: Whether to keep only active requests
+        
+    Returns:
+        SQL string whose parameters are the blood groups, then the city
+    """
+    # status must be a literal so idx_req_lookup is usable
+    conditions = ["status = 'Active'"] if active_only else []
+    conditions.append(f"blood_group IN ({', '.join('?' * group_count)})")
+    if has_city:
+        conditions.append("city_lc = ?")
+    return (
+        _SELECT_COLUMNS.format(total="")
+        + " WHERE " + " AND ".join(conditions)
+        + " ORDER BY created_at DESC, id DESC"
+    )
+
+
+@lru_cache(maxsize=32)
+def _gen_update(columns: frozenset) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Build the UPDATE ... RETURNING statement for a set of columns.
+    
+    Args:
+        columns: Names of the columns being updated
+    
+    Returns:
+        Tuple of (SQL string, column order its parameters must follow).
+        The parameters are the values of those columns, the lower-cased
+        city if city is set, the request id, then the new status if
+        status is set
+    """
+    fields = tuple(sorted(columns))
+    assignments = [f"{field} = ?" for field in fields]
+    if 'city' in columns:
+        # Keep the lower-cased lookup column in step with city
+        assignments.append("city_lc = ?")
+    
+    condition = "id = ?"
+    if 'status' in columns:
+        # A fulfilled request can never go back to Active
+        condition += " AND NOT (status = 'Fulfilled' AND ? = 'Active')"
+    
+    query = f"""
+    UPDATE blood_requests
+    SET {', '.join(assignments)}
+    WHERE {condition}
+    RETURNING id, patient_name, blood_group, city, urgency, hospital_name,
+              contact_number, status, created_at
+    """
+    return query, fields
+
+
+@lru_cache(maxsize=16)
+def _gen_count(keymask: int) -> str:
+    """Generate the COUNT(*) query for one combination of filters."""
+    return "SELECT COUNT(*) FROM blood_requests" + _where_sql(keymask)
+
 
 class BloodRequestRepositoryError(Exception):
     """Custom exception for blood request repository operations."""
@@ -17,14 +173,18 @@ class BloodRequestRepositoryError(Exception):
 class BloodRequestRepository:
     """Repository class for blood request data access operations."""
     
-    def __init__(self, database_path: str = "blood_donation.db"):
+    def __init__(self, database_path: str = "blood_donation.db",
+                 connection: Optional[aiosqlite.Connection] = None):
         """
         Initialize the blood request repository.
         
         Args:
             database_path: Path to the SQLite database file
+            connection: Optional open connection to use instead of the shared
+                        connection for database_path
         """
         self.database_path = database_path
+        self._conn = connection
     
     async def create(self, blood_request: BloodRequestCreate) -> BloodRequest:
         """
@@ -40,46 +200,114 @@ class BloodRequestRepository:
             BloodRequestRepositoryError: If creation fails
         """
         try:
-            async with get_db_session(self.database_path) as connection:
-                # Insert blood request record
-                query = """
-                INSERT INTO blood_requests (patient_name, blood_group, city, urgency, 
-                                          hospital_name, contact_number, status, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """
-                created_at = datetime.now()
-                params = (
-                    blood_request.patient_name,
-                    blood_request.blood_group,
-                    blood_request.city,
-                    blood_request.urgency,
-                    blood_request.hospital_name,
-                    blood_request.contact_number,
-                    "Active",  # Default status
+            connection = await self._get_conn()
+            # Insert blood request record
+            query = """
+            INSERT INTO blood_requests (patient_name, blood_group, city, city_lc, urgency, 
+                                      hospital_name, contact_number, status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """
+            created_at = datetime.now()
+            params = (
+                blood_request.patient_name,
+                blood_request.blood_group,
+                blood_request.city,
+                blood_request.city.lower(),
+                blood_request.urgency,
+                blood_request.hospital_name,
+                blood_request.contact_number,
+                "Active",  # Default status
+                created_at
+            )
+            
+            async with get_write_lock(self.database_path):
+                cursor = await connection.execute(query, params)
+                record_write(self.database_path)
+            
+            request_id = cursor.lastrowid
+            
+            # Return the created blood request with ID
+            return BloodRequest(
+                id=request_id,
+                patient_name=blood_request.patient_name,
+                blood_group=blood_request.blood_group,
+                city=blood_request.city,
+                urgency=blood_request.urgency,
+                hospital_name=blood_request.hospital_name,
+                contact_number=blood_request.contact_number,
+                status="Active",
+                created_at=created_at
+            )
+            
+        except Exception as e:
+            logger.error(f"Error creating blood request: {e}")
+            raise BloodRequestRepositoryError(f"Failed to create blood request: {str(e)}")
+    
+    async def create_many(self, blood_requests: List[BloodRequestCreate]) -> List[BloodRequest]:
+        """
+        Create several blood request records in a single transaction.
+        
+        Args:
+            blood_requests: List of BloodRequestCreate objects to insert
+        
+        Returns:
+            List of created BloodRequest objects, in input order
+        
+        Raises:
+            BloodRequestRepositoryError: If creation fails
+        """
+        if not blood_requests:
+            return []
+        
+        try:
+            query = """
+            INSERT INTO blood_requests (patient_name, blood_group, city, city_lc, urgency,
+                                      hospital_name, contact_number, status, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """
+            created_at = datetime.now()
+            params = [
+                (
+                    r.patient_name,
+                    r.blood_group,
+                    r.city,
+                    r.city.lower(),
+                    r.urgency,
+                    r.hospital_name,
+                    r.contact_number,
+                    "Active",
                     created_at
                 )
-                
-                cursor = await connection.execute(query, params)
-                await connection.commit()
-                
-                request_id = cursor.lastrowid
-                
-                # Return the created blood request with ID
-                return BloodRequest(
-                    id=request_id,
-                    patient_name=blood_request.patient_name,
-                    blood_group=blood_request.blood_group,
-                    city=blood_request.city,
-                    urgency=blood_request.urgency,
-                    hospital_name=blood_request.hospital_name,
-                    contact_number=blood_request.contact_number,
+                for r in blood_requests
+            ]
+            
+            async with write_transaction(self.database_path, self._conn) as connection:
+                await connection.executemany(query, params)
+                cursor = await connection.execute("SELECT last_insert_rowid()")
+                (last_id,) = await cursor.fetchone()
+            
+            # Rows inserted by one executemany inside one transaction get
+            # consecutive ids ending at last_insert_rowid()
+            first_id = last_id - len(blood_requests) + 1
+            
+            return [
+                BloodRequest(
+                    id=first_id + i,
+                    patient_name=r.patient_name,
+                    blood_group=r.blood_group,
+                    city=r.city,
+                    urgency=r.urgency,
+                    hospital_name=r.hospital_name,
+                    contact_number=r.contact_number,
                     status="Active",
                     created_at=created_at
                 )
-                
+                for i, r in enumerate(blood_requests)
+            ]
+        
         except Exception as e:
-            logger.error(f"Error creating blood request: {e}")
-            raise BloodRequestRepositoryError(f"Failed to create blood request: {str(e)}")
+            logger.error(f"Error creating blood requests in bulk: {e}")
+            raise BloodRequestRepositoryError(f"Failed to create blood requests: {str(e)}")
     
     async def get_by_id(self, request_id: int) -> Optional[BloodRequest]:
         """
@@ -95,21 +323,21 @@ class BloodRequestRepository:
             BloodRequestRepositoryError: If retrieval fails
         """
         try:
-            async with get_db_session(self.database_path) as connection:
-                query = """
-                SELECT id, patient_name, blood_group, city, urgency, hospital_name, 
-                       contact_number, status, created_at
-                FROM blood_requests
-                WHERE id = ?
-                """
-                
-                cursor = await connection.execute(query, (request_id,))
-                row = await cursor.fetchone()
-                
-                if row:
-                    return self._row_to_blood_request(row)
-                return None
-                
+            connection = await self._get_conn()
+            query = """
+            SELECT id, patient_name, blood_group, city, urgency, hospital_name, 
+                   contact_number, status, created_at
+            FROM blood_requests
+            WHERE id = ?
+            """
+            
+            cursor = await connection.execute(query, (request_id,))
+            row = await cursor.fetchone()
+            
+            if row:
+                return self._row_to_blood_request(row)
+            return None
+            
         except Exception as e:
             logger.error(f"Error retrieving blood request {request_id}: {e}")
             raise BloodRequestRepositoryError(f"Failed to retrieve blood request: {str(e)}")
@@ -125,64 +353,93 @@ class BloodRequestRepository:
                     - urgency: Filter by urgency level
                     - status: Filter by status
                     - limit: Maximum number of results
-                    - offset: Number of results to skip
+                    - cursor: ID of the last request on the previous page;
+                      returns the requests that follow it
+                    - offset: Number of results to skip (deprecated, cost
+                      grows with the offset; use cursor instead)
             
         Returns:
-            List of BloodRequest objects
+            List of BloodRequest objects, newest first
+            
+        Raises:
+            BloodRequestRepositoryError: If retrieval fails
+        """
+        return [blood_request async for blood_request in self.iter_all(filters)]
+    
+    async def iter_all(self, filters: Optional[Dict[str, Any]] = None) -> AsyncIterator[BloodRequest]:
+        """
+        Stream blood requests one row at a time with optional filtering.
+        
+        Accepts the same filters as get_all but yields results as they are
+        read from the cursor instead of building a list.
+        
+        Args:
+            filters: Optional dictionary with filter criteria
+            
+        Yields:
+            BloodRequest objects, newest first
             
         Raises:
             BloodRequestRepositoryError: If retrieval fails
         """
         try:
-            async with get_db_session(self.database_path) as connection:
-                query = """
-                SELECT id, patient_name, blood_group, city, urgency, hospital_name, 
-                       contact_number, status, created_at
-                FROM blood_requests
-                """
-                params = []
-                where_conditions = []
-                
-                if filters:
-                    if 'blood_group' in filters and filters['blood_group']:
-                        where_conditions.append("blood_group = ?")
-                        params.append(filters['blood_group'])
-                    
-                    if 'city' in filters and filters['city']:
-                        where_conditions.append("LOWER(city) = LOWER(?)")
-                        params.append(filters['city'])
-                    
-                    if 'urgency' in filters and filters['urgency']:
-                        where_conditions.append("urgency = ?")
-                        params.append(filters['urgency'])
-                    
-                    if 'status' in filters and filters['status']:
-                        where_conditions.append("status = ?")
-                        params.append(filters['status'])
-                
-                if where_conditions:
-                    query += " WHERE " + " AND ".join(where_conditions)
-                
-                query += " ORDER BY created_at DESC"
-                
-                # Add pagination if specified
-                if filters and 'limit' in filters:
-                    query += " LIMIT ?"
-                    params.append(filters['limit'])
-                    
-                    if 'offset' in filters:
-                        query += " OFFSET ?"
-                        params.append(filters['offset'])
-                
-                cursor = await connection.execute(query, params)
-                rows = await cursor.fetchall()
-                
-                return [self._row_to_blood_request(row) for row in rows]
-                
+            connection = await self._get_conn()
+            keymask, params = self._filter_args(filters)
+            query = _gen_select(keymask)
+            
+            cursor = await connection.execute(query, params)
+            # Rows cross from the database thread in batches of this size
+            cursor.arraysize = _FETCH_BATCH
+            async for row in cursor:
+                yield self._row_to_blood_request(row)
+            
         except Exception as e:
             logger.error(f"Error retrieving blood requests: {e}")
             raise BloodRequestRepositoryError(f"Failed to retrieve blood requests: {str(e)}")
     
+    async def get_all_with_total(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[BloodRequest], int]:
+        """
+        Retrieve a page of blood requests together with the total match count.
+        
+        Accepts the same filters as get_all. The total ignores limit/offset
+        and comes from a window function in the same query; with a cursor
+        it counts the matches that follow the cursor.
+        
+        Args:
+            filters: Optional dictionary with filter criteria
+            
+        Returns:
+            Tuple of (list of BloodRequest objects, total matching requests)
+            
+        Raises:
+            BloodRequestRepositoryError: If retrieval fails
+        """
+        try:
+            connection = await self._get_conn()
+            keymask, params = self._filter_args(filters)
+            query = _gen_select(keymask, with_total=True)
+            
+            cursor = await connection.execute(query, params)
+            rows = await cursor.fetchall()
+            
+            if rows:
+                total = rows[0][-1]
+            elif filters and filters.get('offset'):
+                # Page is past the end; the window count is not available
+                total = await self.count_requests(filters)
+            else:
+                total = 0
+            
+            return [self._row_to_blood_request(row[:-1]) for row in rows], total
+            
+        except BloodRequestRepositoryError:
+            raise
+        except Exception as e:
+            logger.error(f"Error retrieving blood requests with total: {e}")
+            raise BloodRequestRepositoryError(f"Failed to retrieve blood requests: {str(e)}")
+    
     async def update(self, request_id: int, request_update: BloodRequestUpdate) -> Optional[BloodRequest]:
         """
         Update an existing blood request record.
@@ -193,48 +450,41 @@ class BloodRequestRepository:
             
         Returns:
             Updated BloodRequest object if successful, None if request not found
+            or the update would reactivate a fulfilled request
             
         Raises:
             BloodRequestRepositoryError: If update fails
         """
         try:
-            async with get_db_session(self.database_path) as connection:
-                # First check if blood request exists
-                existing_request = await self.get_by_id(request_id)
-                if not existing_request:
-                    return None
-                
-                # Build update query dynamically based on provided fields
-                update_fields = []
-                params = []
-                
-                update_data = request_update.dict(exclude_unset=True)
-                
-                for field, value in update_data.items():
-                    if value is not None:
-                        update_fields.append(f"{field} = ?")
-                        params.append(value)
-                
-                if not update_fields:
-                    # No fields to update, return existing request
-                    return existing_request
-                
-                query = f"""
-                UPDATE blood_requests
-                SET {', '.join(update_fields)}
-                WHERE id = ?
-                """
-                params.append(request_id)
-                
+            update_data = {
+                field: value
+                for field, value in request_update.model_dump(exclude_unset=True).items()
+                if value is not None
+            }
+            
+            if not update_data:
+                # No fields to update, return existing request
+                return await self.get_by_id(request_id)
+            
+            query, fields = _gen_update(frozenset(update_data))
+            
+            params = [update_data[field] for field in fields]
+            if 'city' in update_data:
+                params.append(update_data['city'].lower())
+            params.append(request_id)
+            if 'status' in update_data:
+                params.append(update_data['status'])
+            
+            connection = await self._get_conn()
+            async with get_write_lock(self.database_path):
                 cursor = await connection.execute(query, params)
-                await connection.commit()
-                
-                if cursor.rowcount > 0:
-                    # Return updated blood request
-                    return await self.get_by_id(request_id)
-                else:
-                    return None
-                    
+                record_write(self.database_path)
+                row = await cursor.fetchone()
+            
+            if row is None:
+                return None
+            return self._row_to_blood_request(row)
+            
         except Exception as e:
             logger.error(f"Error updating blood request {request_id}: {e}")
             raise BloodRequestRepositoryError(f"Failed to update blood request: {str(e)}")
@@ -253,22 +503,27 @@ class BloodRequestRepository:
             BloodRequestRepositoryError: If deletion fails
         """
         try:
-            async with get_db_session(self.database_path) as connection:
-                query = "DELETE FROM blood_requests WHERE id = ?"
-                
+            connection = await self._get_conn()
+            query = "DELETE FROM blood_requests WHERE id = ?"
+            
+            async with get_write_lock(self.database_path):
                 cursor = await connection.execute(query, (request_id,))
-                await connection.commit()
-                
-                return cursor.rowcount > 0
-                
+                record_write(self.database_path)
+            
+            return cursor.rowcount > 0
+            
         except Exception as e:
             logger.error(f"Error deleting blood request {request_id}: {e}")
             raise BloodRequestRepositoryError(f"Failed to delete blood request: {str(e)}")
     
-    async def get_active_requests(self) -> List[BloodRequest]:
+    async def get_active_requests(self, limit: Optional[int] = None, offset: int = 0) -> List[BloodRequest]:
         """
-        Retrieve all active blood requests.
+        Retrieve active blood requests, newest first.
         
+        Args:
+            limit: Maximum number of results, or None for every active request
+            offset: Number of results to skip
+            
         Returns:
             List of active BloodRequest objects
             
@@ -276,8 +531,23 @@ class BloodRequestRepository:
             BloodRequestRepositoryError: If retrieval fails
         """
         try:
-            filters = {'status': 'Active'}
-            return await self.get_all(filters)
+            # status must be a literal for the partial index idx_active_created_id
+            # to apply; it yields rows in ORDER BY order, so no sort is needed
+            query = """
+            SELECT id, patient_name, blood_group, city, urgency, hospital_name, 
+                   contact_number, status, created_at
+            FROM blood_requests
+            WHERE status = 'Active'
+            ORDER BY created_at DESC, id DESC
+            LIMIT ? OFFSET ?
+            """
+            params = (-1 if limit is None else limit, offset)
+            
+            connection = await self._get_conn()
+            cursor = await connection.execute(query, params)
+            rows = await cursor.fetchall()
+            
+            return [self._row_to_blood_request(row) for row in rows]
             
         except Exception as e:
             logger.error(f"Error retrieving active blood requests: {e}")
@@ -329,6 +599,46 @@ class BloodRequestRepository:
             logger.error(f"Error retrieving blood requests by blood group {blood_group} and city {city}: {e}")
             raise BloodRequestRepositoryError(f"Failed to retrieve blood requests: {str(e)}")
     
+    async def get_requests_matching_donor(
+        self,
+        recipient_groups: Sequence[str],
+        city: Optional[str] = None,
+        active_only: bool = True
+    ) -> List[BloodRequest]:
+        """
+        Retrieve blood requests whose blood group can receive from a donor.
+        
+        Args:
+            recipient_groups: Blood groups that can receive the donor's blood
+            city: Optional city to filter by (case-insensitive)
+            active_only: Whether to only include active requests
+            
+        Returns:
+            List of matching BloodRequest objects, newest first
+            
+        Raises:
+            BloodRequestRepositoryError: If retrieval fails
+        """
+        try:
+            if not recipient_groups:
+                return []
+            
+            # Sorted so equal sets share one cached statement and plan
+            params: List[Any] = sorted(recipient_groups)
+            if city is not None:
+                params.append(city.lower())
+            query = _gen_matching_select(len(recipient_groups), city is not None, active_only)
+            
+            connection = await self._get_conn()
+            cursor = await connection.execute(query, params)
+            rows = await cursor.fetchall()
+            
+            return [self._row_to_blood_request(row) for row in rows]
+            
+        except Exception as e:
+            logger.error(f"Error retrieving blood requests for recipient groups {recipient_groups}: {e}")
+            raise BloodRequestRepositoryError(f"Failed to retrieve blood requests: {str(e)}")
+    
     async def fulfill_request(self, request_id: int) -> Optional[BloodRequest]:
         """
         Mark a blood request as fulfilled.
@@ -338,18 +648,67 @@ class BloodRequestRepository:
             
         Returns:
             Updated BloodRequest object if successful, None if request not found
+            or already fulfilled
             
         Raises:
             BloodRequestRepositoryError: If fulfillment fails
         """
         try:
-            update_data = BloodRequestUpdate(status="Fulfilled")
-            return await self.update(request_id, update_data)
+            connection = await self._get_conn()
+            async with get_write_lock(self.database_path):
+                cursor = await connection.execute(_SQL_FULFILL, (request_id,))
+                record_write(self.database_path)
+                row = await cursor.fetchone()
+            
+            if row is None:
+                return None
+            return self._row_to_blood_request(row)
             
         except Exception as e:
             logger.error(f"Error fulfilling blood request {request_id}: {e}")
             raise BloodRequestRepositoryError(f"Failed to fulfill blood request: {str(e)}")
     
+    async def bulk_fulfill(self, request_ids: List[int]) -> List[int]:
+        """
+        Mark several blood requests as fulfilled in one statement.
+        
+        Args:
+            request_ids: IDs of the blood requests to fulfill
+            
+        Returns:
+            Sorted IDs of the requests that were fulfilled; missing and
+            already fulfilled requests are left out
+            
+        Raises:
+            BloodRequestRepositoryError: If fulfillment fails
+        """
+        try:
+            return await self._bulk_write(_SQL_BULK_FULFILL, request_ids)
+            
+        except Exception as e:
+            logger.error(f"Error fulfilling blood requests in bulk: {e}")
+            raise BloodRequestRepositoryError(f"Failed to fulfill blood requests: {str(e)}")
+    
+    async def bulk_delete(self, request_ids: List[int]) -> List[int]:
+        """
+        Delete several blood requests in one statement.
+        
+        Args:
+            request_ids: IDs of the blood requests to delete
+            
+        Returns:
+            Sorted IDs of the requests that were deleted
+            
+        Raises:
+            BloodRequestRepositoryError: If deletion fails
+        """
+        try:
+            return await self._bulk_write(_SQL_BULK_DELETE, request_ids)
+            
+        except Exception as e:
+            logger.error(f"Error deleting blood requests in bulk: {e}")
+            raise BloodRequestRepositoryError(f"Failed to delete blood requests: {str(e)}")
+    
     async def count_requests(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count total number of blood requests with optional filtering.
@@ -364,40 +723,112 @@ class BloodRequestRepository:
             BloodRequestRepositoryError: If count fails
         """
         try:
-            async with get_db_session(self.database_path) as connection:
-                query = "SELECT COUNT(*) FROM blood_requests"
-                params = []
-                where_conditions = []
-                
-                if filters:
-                    if 'blood_group' in filters and filters['blood_group']:
-                        where_conditions.append("blood_group = ?")
-                        params.append(filters['blood_group'])
-                    
-                    if 'city' in filters and filters['city']:
-                        where_conditions.append("LOWER(city) = LOWER(?)")
-                        params.append(filters['city'])
-                    
-                    if 'urgency' in filters and filters['urgency']:
-                        where_conditions.append("urgency = ?")
-                        params.append(filters['urgency'])
-                    
-                    if 'status' in filters and filters['status']:
-                        where_conditions.append("status = ?")
-                        params.append(filters['status'])
-                
-                if where_conditions:
-                    query += " WHERE " + " AND ".join(where_conditions)
-                
-                cursor = await connection.execute(query, params)
-                result = await cursor.fetchone()
-                
-                return result[0] if result else 0
-                
+            connection = await self._get_conn()
+            keymask, params = self._filter_args(filters, paginate=False)
+            query = _gen_count(keymask)
+            
+            cursor = await connection.execute(query, params)
+            result = await cursor.fetchone()
+            
+            return result[0] if result else 0
+            
         except Exception as e:
             logger.error(f"Error counting blood requests: {e}")
             raise BloodRequestRepositoryError(f"Failed to count blood requests: {str(e)}")
     
+    async def get_distribution_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Count blood requests per status, urgency, blood group and city.
+        
+        Each distribution is one GROUP BY query; the four run concurrently.
+        
+        Returns:
+            Dictionary keyed by column name, each mapping a value to its
+            request count. Values with no requests are absent.
+            
+        Raises:
+            BloodRequestRepositoryError: If the aggregation fails
+        """
+        try:
+            connection = await self._get_conn()
+            
+            async def group_counts(column: str) -> Dict[str, int]:
+                cursor = await connection.execute(
+                    f"SELECT {column}, COUNT(*) FROM blood_requests GROUP BY {column}"
+                )
+                return dict(await cursor.fetchall())
+            
+            results = await asyncio.gather(*(group_counts(column) for column in _DISTRIBUTION_COLS))
+            return dict(zip(_DISTRIBUTION_COLS, results))
+            
+        except Exception as e:
+            logger.error(f"Error computing blood request distribution: {e}")
+            raise BloodRequestRepositoryError(f"Failed to compute blood request statistics: {str(e)}")
+    
+    async def _bulk_write(self, query: str, request_ids: List[int]) -> List[int]:
+        """Run a bulk statement over request_ids and return the affected IDs."""
+        if not request_ids:
+            return []
+        
+        connection = await self._get_conn()
+        async with get_write_lock(self.database_path):
+            cursor = await connection.execute(query, (json.dumps(request_ids),))
+            record_write(self.database_path)
+            rows = await cursor.fetchall()
+        
+        return sorted(row[0] for row in rows)
+    
+    async def _get_conn(self) -> aiosqlite.Connection:
+        """
+        Get the connection this repository runs its queries on.
+        
+        Returns:
+            The injected connection, or the shared connection for database_path
+        """
+        if self._conn is not None:
+            return self._conn
+        return await get_pool(self.database_path)
+    
+    def _filter_args(self, filters: Optional[Dict[str, Any]],
+                     paginate: bool = True) -> Tuple[int, List[Any]]:
+        """
+        Compute the query key mask and parameters for the given filters.
+        
+        Args:
+            filters: Optional dictionary with filter criteria
+            paginate: Whether to include cursor/limit/offset
+            
+        Returns:
+            Tuple of (key mask for _gen_select/_gen_count, list of parameters)
+        """
+        if not filters:
+            return 0, []
+        
+        keymask = 0
+        params = []
+        for bit, key in enumerate(_FILTER_COLS):
+            value = filters.get(key)
+            if value:
+                keymask |= 1 << bit
+                params.append(value.lower() if key == 'city' else value)
+        
+        if not paginate:
+            return keymask, params
+        
+        if filters.get('cursor') is not None:
+            keymask |= _CURSOR_BIT
+            params.extend((filters['cursor'], filters['cursor']))
+        
+        if 'limit' in filters:
+            keymask |= _LIMIT_BIT
+            params.append(filters['limit'])
+            
+            if 'offset' in filters:
+                keymask |= _OFFSET_BIT
+                params.append(filters['offset'])
+        
+        return keymask, params
+    
     def _row_to_blood_request(self, row: tuple) -> BloodRequest:
         """
         Convert database row to BloodRequest object.
@@ -408,14 +839,18 @@ class BloodRequestRepository:
         Returns:
             BloodRequest object
         """
-        return BloodRequest(
-            id=row[0],
-            patient_name=row[1],
-            blood_group=row[2],
-            city=row[3],
-            urgency=row[4],
-            hospital_name=row[5],
-            contact_number=row[6],
-            status=row[7],
-            created_at=datetime.fromisoformat(row[8]) if row[8] else None
+        (request_id, patient_name, blood_group, city, urgency,
+         hospital_name, contact_number, status, created_at) = row
+        
+        # Rows were validated on the way in, so skip re-validation here
+        return BloodRequest.model_construct(
+            id=request_id,
+            patient_name=patient_name,
+            blood_group=blood_group,
+            city=city,
+            urgency=urgency,
+            hospital_name=hospital_name,
+            contact_number=contact_number,
+            status=status,
+            created_at=created_at
         )
\ No newline at end of file
@@ -1,31 +1,195 @@
-from typing import List, Optional, Dict, Any
+import asyncio
+import functools
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, Final, Iterable, List, Optional, Sequence, Tuple
+import json
 import logging
+import sqlite3
 from datetime import datetime
 import aiosqlite
 
 from models.donor import Donor, DonorCreate, DonorUpdate
-from database.connection import get_db_session
+from database.connection import get_pool, get_write_lock, record_write, write_transaction
 
 logger = logging.getLogger(__name__)
 
+_SELECT_DONORS: Final[str] = (
+    "SELECT id, name, blood_group, city, contact_number, email, created_at FROM donors"
+)
+
+
+# Keyset conditions for a (created_at, id) cursor and for a donor id cursor
+_CURSOR_VALUES_SQL: Final[str] = "(created_at, id) < (?, ?)"
+_CURSOR_ID_SQL: Final[str] = (
+    "(created_at, id) < ((SELECT created_at FROM donors WHERE id = ?), ?)"
+)
+
+
+@lru_cache(maxsize=16)
+def _select_sql(has_blood_group: bool, has_city: bool, cursor_sql: str = "") -> str:
+    """
+    Build the donor SELECT for one filter combination, newest first.
+    
+    Parameters are bound as blood_group, city, then the keyset cursor
+    values for whichever parts are present.
+    """
+    conditions = []
+    if has_blood_group:
+        conditions.append("blood_group = ?")
+    if has_city:
+        conditions.append("city = ? COLLATE NOCASE")
+    if cursor_sql:
+        conditions.append(cursor_sql)
+    
+    query = _SELECT_DONORS
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    return query + " ORDER BY created_at DESC, id DESC"
+
+
+@lru_cache(maxsize=64)
+def _match_sql(group_count: int, exact_city: bool, has_limit: bool) -> str:
+    """
+    Build the SELECT for donors of any of several blood groups, best match first.
+    
+    Parameters are bound as the blood groups, the city (when exact_city),
+    the city and preferred blood group used for ranking, then the limit.
+    A plain IN list lets the planner seek each group on the blood group
+    indexes.
+    """
+    placeholders = ", ".join("?" * group_count)
+    query = _SELECT_DONORS + f" WHERE blood_group IN ({placeholders})"
+    if exact_city:
+        query += " AND city = ? COLLATE NOCASE"
+    query += (
+        " ORDER BY city = ? COLLATE NOCASE DESC, blood_group = ? DESC,"
+        " created_at DESC, id DESC"
+    )
+    if has_limit:
+        query += " LIMIT ?"
+    return query
+
+
+# Fixed donor queries, newest first
+_SQL_ALL: Final[str] = _select_sql(False, False)
+_SQL_BG: Final[str] = _select_sql(True, False)
+_SQL_CITY: Final[str] = _select_sql(False, True)
+_SQL_BG_CITY: Final[str] = _select_sql(True, True)
+
+_SQL_SELECT_BY_ID: Final[str] = _SELECT_DONORS + " WHERE id = ?"
+_SQL_EXISTS_BY_ID: Final[str] = "SELECT 1 FROM donors WHERE id = ?"
+_SQL_INSERT: Final[str] = (
+    "INSERT INTO donors (name, blood_group, city, contact_number, email, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_SQL_DELETE: Final[str] = "DELETE FROM donors WHERE id = ?"
+_SQL_CONTACT_EXISTS: Final[str] = "SELECT 1 FROM donors WHERE contact_number = ? LIMIT 1"
+_SQL_CONTACT_EXISTS_OTHER: Final[str] = (
+    "SELECT 1 FROM donors WHERE contact_number = ? AND id != ? LIMIT 1"
+)
+_SQL_CONTACT_EXISTS_ANY: Final[str] = (
+    "SELECT contact_number FROM donors "
+    "WHERE contact_number IN (SELECT value FROM json_each(?)) LIMIT 1"
+)
+_SQL_LAST_ID: Final[str] = "SELECT last_insert_rowid()"
+
+_SQL_COUNT_ALL: Final[str] = "SELECT COALESCE(SUM(n), 0) FROM donor_counts"
+_SQL_COUNT_BG: Final[str] = "SELECT n FROM donor_counts WHERE blood_group = ?"
+_SQL_COUNT_CITY: Final[str] = "SELECT COUNT(*) FROM donors WHERE city = ? COLLATE NOCASE"
+_SQL_COUNT_BG_CITY: Final[str] = (
+    "SELECT COUNT(*) FROM donors WHERE city = ? COLLATE NOCASE AND blood_group = ?"
+)
+_SQL_COUNT_BY_BG: Final[str] = "SELECT blood_group, n FROM donor_counts"
+
+# COUNT(*) equivalents of the donor_counts queries, for databases where
+# init_database has not created that table yet
+_DONOR_COUNTS_FALLBACK: Final[Dict[str, str]] = {
+    _SQL_COUNT_ALL: "SELECT COUNT(*) FROM donors",
+    _SQL_COUNT_BG: "SELECT COUNT(*) FROM donors WHERE blood_group = ?",
+    _SQL_COUNT_BY_BG: "SELECT blood_group, COUNT(*) FROM donors GROUP BY blood_group",
+}
+_SQL_COUNT_BY_CITY: Final[str] = "SELECT city, COUNT(*) FROM donors GROUP BY city COLLATE NOCASE"
+
+
+@lru_cache(maxsize=32)
+def _update_sql(fields: Tuple[str, ...]) -> str:
+    """Return the UPDATE ... RETURNING statement for a sorted tuple of columns."""
+    assignments = ", ".join(f"{field} = ?" for field in fields)
+    return (
+        f"UPDATE donors SET {assignments} WHERE id = ? "
+        "RETURNING id, name, blood_group, city, contact_number, email, created_at"
+    )
+
+
+# Rows pulled from the cursor per round trip to the database thread
+_FETCH_BATCH: Final[int] = 1000
+
+
+# Column order of _SELECT_DONORS matches the Donor field order
+_DONOR_FIELDS: Final = tuple(Donor.model_fields)
+
+
+def _rows_to_donors(rows: Sequence[tuple]) -> List[Donor]:
+    """
+    Convert donor rows to Donor objects without running validation.
+    
+    Rows passed the model and schema constraints when they were inserted,
+    so they are built with model_construct instead of full validation.
+    
+    Args:
+        rows: Database row tuples in _SELECT_DONORS column order
+        
+    Returns:
+        List of Donor objects, in row order
+    """
+    construct = Donor.model_construct
+    fields = _DONOR_FIELDS
+    return [construct(**dict(zip(fields, row))) for row in rows]
+
 
 class DonorRepositoryError(Exception):
     """Custom exception for donor repository operations."""
     pass
 
 
+def _wrap_errors(op: str):
+    """
+    Wrap a repository coroutine so failures surface as DonorRepositoryError.
+    
+    Args:
+        op: Description of the operation used in the log and error message
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except DonorRepositoryError:
+                raise
+            except Exception as e:
+                logger.error("Failed to %s: %s", op, e)
+                raise DonorRepositoryError(f"Failed to {op}: {str(e)}") from e
+        return wrapper
+    return decorator
+
+
 class DonorRepository:
     """Repository class for donor data access operations."""
     
-    def __init__(self, database_path: str = "blood_donation.db"):
+    def __init__(self, database_path: str = "blood_donation.db",
+                 connection: Optional[aiosqlite.Connection] = None):
         """
         Initialize the donor repository.
         
         Args:
             database_path: Path to the SQLite database file
+            connection: Optional open connection to use instead of the shared
+                        connection for database_path
         """
         self.database_path = database_path
+        self._conn = connection
     
+    @_wrap_errors("create donor")
     async def create(self, donor: DonorCreate) -> Donor:
         """
         Create a new donor record.
@@ -39,43 +203,29 @@ class DonorRepository:
         Raises:
             DonorRepositoryError: If creation fails
         """
-        try:
-            async with get_db_session(self.database_path) as connection:
-                # Insert donor record
-                query = """
-                INSERT INTO donors (name, blood_group, city, contact_number, email, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """
-                created_at = datetime.now()
-                params = (
-                    donor.name,
-                    donor.blood_group,
-                    donor.city,
-                    donor.contact_number,
-                    donor.email,
-                    created_at
-                )
-                
-                cursor = await connection.execute(query, params)
-                await connection.commit()
-                
-                donor_id = cursor.lastrowid
-                
-                # Return the created donor with ID
-                return Donor(
-                    id=donor_id,
-                    name=donor.name,
-                    blood_group=donor.blood_group,
-                    city=donor.city,
-                    contact_number=donor.contact_number,
-                    email=donor.email,
-                    created_at=created_at
-                )
-                
-        except Exception as e:
-            logger.error(f"Error creating donor: {e}")
-            raise DonorRepositoryError(f"Failed to create donor: {str(e)}")
+        created = await self._insert_many([donor])
+        return created[0]
     
+    @_wrap_errors("create donors")
+    async def create_many(self, donors: List[DonorCreate]) -> List[Donor]:
+        """
+        Create several donor records in a single transaction.
+        
+        Args:
+            donors: List of DonorCreate objects to insert
+            
+        Returns:
+            List of created Donor objects, in input order
+            
+        Raises:
+            DonorRepositoryError: If creation fails
+        """
+        if not donors:
+            return []
+        
+        return await self._insert_many(donors)
+    
+    @_wrap_errors("retrieve donor")
     async def get_by_id(self, donor_id: int) -> Optional[Donor]:
         """
         Retrieve a donor by ID.
@@ -89,25 +239,85 @@ class DonorRepository:
         Raises:
             DonorRepositoryError: If retrieval fails
         """
-        try:
-            async with get_db_session(self.database_path) as connection:
-                query = """
-                SELECT id, name, blood_group, city, contact_number, email, created_at
-                FROM donors
-                WHERE id = ?
-                """
-                
-                cursor = await connection.execute(query, (donor_id,))
-                row = await cursor.fetchone()
-                
-                if row:
-                    return self._row_to_donor(row)
-                return None
-                
-        except Exception as e:
-            logger.error(f"Error retrieving donor {donor_id}: {e}")
-            raise DonorRepositoryError(f"Failed to retrieve donor: {str(e)}")
+        connection = await self._get_conn()
+        cursor = await connection.execute(_SQL_SELECT_BY_ID, (donor_id,))
+        row = await cursor.fetchone()
+        
+        if row:
+            return self._row_to_donor(row)
+        return None
+    
+    @_wrap_errors("check donor")
+    async def exists_by_id(self, donor_id: int) -> bool:
+        """
+        Check whether a donor exists without loading its row.
+        
+        Args:
+            donor_id: ID of the donor to look for
+            
+        Returns:
+            True if the donor exists, False otherwise
+            
+        Raises:
+            DonorRepositoryError: If the lookup fails
+        """
+        connection = await self._get_conn()
+        cursor = await connection.execute(_SQL_EXISTS_BY_ID, (donor_id,))
+        return await cursor.fetchone() is not None
+    
+    @_wrap_errors("check donor contact number")
+    async def exists_by_contact_number(
+        self, contact_number: str, exclude_id: Optional[int] = None
+    ) -> bool:
+        """
+        Check whether a donor is registered with a contact number.
+        
+        Answered from the contact_number index without loading the
+        donor row.
+        
+        Args:
+            contact_number: Contact number to look for
+            exclude_id: Optional donor ID to ignore (the donor being updated)
+            
+        Returns:
+            True if another donor uses the contact number, False otherwise
+            
+        Raises:
+            DonorRepositoryError: If the lookup fails
+        """
+        if exclude_id is None:
+            query, params = _SQL_CONTACT_EXISTS, (contact_number,)
+        else:
+            query, params = _SQL_CONTACT_EXISTS_OTHER, (contact_number, exclude_id)
+        
+        connection = await self._get_conn()
+        cursor = await connection.execute(query, params)
+        return await cursor.fetchone() is not None
+    
+    @_wrap_errors("check donor contact numbers")
+    async def find_existing_contact_number(self, contact_numbers: Iterable[str]) -> Optional[str]:
+        """
+        Find a contact number, out of several, that a donor already uses.
+        
+        Runs one query against the contact_number index for the whole batch.
+        
+        Args:
+            contact_numbers: Contact numbers to look for
+            
+        Returns:
+            One of the contact numbers already registered, or None
+            
+        Raises:
+            DonorRepositoryError: If the lookup fails
+        """
+        connection = await self._get_conn()
+        cursor = await connection.execute(
+            _SQL_CONTACT_EXISTS_ANY, (json.dumps(list(contact_numbers)),)
+        )
+        row = await cursor.fetchone()
+        return row[0] if row else None
     
+    @_wrap_errors("retrieve donors")
     async def get_all(self, filters: Optional[Dict[str, Any]] = None) -> List[Donor]:
         """
         Retrieve all donors with optional filtering.
@@ -117,55 +327,78 @@ class DonorRepository:
                     - blood_group: Filter by blood group
                     - city: Filter by city
                     - limit: Maximum number of results
-                    - offset: Number of results to skip
+                    - cursor: ID, or (created_at, id), of the last donor
+                      on the previous page; returns the donors that follow it
+                    - offset: Number of results to skip (deprecated, cost
+                      grows with the offset; use cursor instead)
             
         Returns:
-            List of Donor objects
+            List of Donor objects, newest first
+            
+        Raises:
+            DonorRepositoryError: If retrieval fails
+        """
+        query, params = self._build_select(filters)
+        return await self._fetch_donors(query, params)
+    
+    async def iter_all(
+        self, filters: Optional[Dict[str, Any]] = None, chunk: int = 500
+    ) -> AsyncIterator[List[Donor]]:
+        """
+        Stream donors in chunks instead of building one list.
+        
+        Args:
+            filters: Optional dictionary with the same criteria as get_all
+            chunk: Number of donors per yielded list
+            
+        Yields:
+            Lists of up to chunk Donor objects, newest first
             
         Raises:
             DonorRepositoryError: If retrieval fails
         """
         try:
-            async with get_db_session(self.database_path) as connection:
-                query = """
-                SELECT id, name, blood_group, city, contact_number, email, created_at
-                FROM donors
-                """
-                params = []
-                where_conditions = []
-                
-                if filters:
-                    if 'blood_group' in filters and filters['blood_group']:
-                        where_conditions.append("blood_group = ?")
-                        params.append(filters['blood_group'])
-                    
-                    if 'city' in filters and filters['city']:
-                        where_conditions.append("LOWER(city) = LOWER(?)")
-                        params.append(filters['city'])
-                
-                if where_conditions:
-                    query += " WHERE " + " AND ".join(where_conditions)
-                
-                query += " ORDER BY created_at DESC"
-                
-                # Add pagination if specified
-                if filters and 'limit' in filters:
-                    query += " LIMIT ?"
-                    params.append(filters['limit'])
-                    
-                    if 'offset' in filters:
-                        query += " OFFSET ?"
-                        params.append(filters['offset'])
-                
-                cursor = await connection.execute(query, params)
-                rows = await cursor.fetchall()
-                
-                return [self._row_to_donor(row) for row in rows]
+            query, params = self._build_select(filters)
+            
+            connection = await self._get_conn()
+            cursor = await connection.execute(query, params)
+            while True:
+                rows = await cursor.fetchmany(chunk)
+                if not rows:
+                    break
+                yield _rows_to_donors(rows)
                 
         except Exception as e:
-            logger.error(f"Error retrieving donors: {e}")
+            logger.error("Error streaming donors: %s", e)
             raise DonorRepositoryError(f"Failed to retrieve donors: {str(e)}")
     
+    async def list_and_count(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Donor], int]:
+        """
+        Retrieve a page of donors together with the total match count.
+        
+        The page query and the count are issued concurrently.
+        
+        Args:
+            filters: Optional dictionary with the same criteria as get_all
+            
+        Returns:
+            Tuple of (list of Donor objects, total donors matching the filters)
+            
+        Raises:
+            DonorRepositoryError: If retrieval fails
+        """
+        filters = filters or {}
+        count_filters = {k: v for k, v in filters.items() if k not in ('limit', 'offset')}
+        
+        donors, total = await asyncio.gather(
+            self.get_all(filters),
+            self.count_donors(count_filters)
+        )
+        return donors, total
+    
+    @_wrap_errors("update donor")
     async def update(self, donor_id: int, donor_update: DonorUpdate) -> Optional[Donor]:
         """
         Update an existing donor record.
@@ -180,48 +413,30 @@ class DonorRepository:
         Raises:
             DonorRepositoryError: If update fails
         """
-        try:
-            async with get_db_session(self.database_path) as connection:
-                # First check if donor exists
-                existing_donor = await self.get_by_id(donor_id)
-                if not existing_donor:
-                    return None
-                
-                # Build update query dynamically based on provided fields
-                update_fields = []
-                params = []
-                
-                update_data = donor_update.dict(exclude_unset=True)
-                
-                for field, value in update_data.items():
-                    if value is not None:
-                        update_fields.append(f"{field} = ?")
-                        params.append(value)
-                
-                if not update_fields:
-                    # No fields to update, return existing donor
-                    return existing_donor
-                
-                query = f"""
-                UPDATE donors
-                SET {', '.join(update_fields)}
-                WHERE id = ?
-                """
-                params.append(donor_id)
-                
-                cursor = await connection.execute(query, params)
-                await connection.commit()
-                
-                if cursor.rowcount > 0:
-                    # Return updated donor
-                    return await self.get_by_id(donor_id)
-                else:
-                    return None
-                    
-        except Exception as e:
-            logger.error(f"Error updating donor {donor_id}: {e}")
-            raise DonorRepositoryError(f"Failed to update donor: {str(e)}")
+        update_data = donor_update.model_dump(exclude_unset=True)
+        fields = tuple(sorted(
+            field for field, value in update_data.items() if value is not None
+        ))
+        
+        if not fields:
+            # No fields to update, return existing donor
+            return await self.get_by_id(donor_id)
+        
+        query = _update_sql(fields)
+        params = [update_data[field] for field in fields]
+        params.append(donor_id)
+        
+        connection = await self._get_conn()
+        async with get_write_lock(self.database_path):
+            cursor = await connection.execute(query, params)
+            record_write(self.database_path)
+            row = await cursor.fetchone()
+        
+        if row is None:
+            return None
+        return self._row_to_donor(row)
     
+    @_wrap_errors("delete donor")
     async def delete(self, donor_id: int) -> bool:
         """
         Delete a donor record.
@@ -235,19 +450,14 @@ class DonorRepository:
         Raises:
             DonorRepositoryError: If deletion fails
         """
-        try:
-            async with get_db_session(self.database_path) as connection:
-                query = "DELETE FROM donors WHERE id = ?"
-                
-                cursor = await connection.execute(query, (donor_id,))
-                await connection.commit()
-                
-                return cursor.rowcount > 0
-                
-        except Exception as e:
-            logger.error(f"Error deleting donor {donor_id}: {e}")
-            raise DonorRepositoryError(f"Failed to delete donor: {str(e)}")
+        connection = await self._get_conn()
+        async with get_write_lock(self.database_path):
+            cursor = await connection.execute(_SQL_DELETE, (donor_id,))
+            record_write(self.database_path)
+        
+        return cursor.rowcount > 0
     
+    @_wrap_errors("search donors")
     async def search_by_blood_group_and_city(self, blood_group: str, city: str) -> List[Donor]:
         """
         Search donors by blood group and city.
@@ -262,17 +472,51 @@ class DonorRepository:
         Raises:
             DonorRepositoryError: If search fails
         """
-        try:
-            filters = {
-                'blood_group': blood_group,
-                'city': city
-            }
-            return await self.get_all(filters)
+        return await self._fetch_donors(_SQL_BG_CITY, (blood_group, city))
+    
+    @_wrap_errors("search donors")
+    async def search_by_blood_groups_and_city(
+        self,
+        blood_groups: Iterable[str],
+        city: str,
+        exact_city: bool = True,
+        preferred_blood_group: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Donor]:
+        """
+        Search donors of any of several blood groups in one query.
+        
+        Donors in the given city come first, then those with the preferred
+        blood group, then the newest.
+        
+        Args:
+            blood_groups: Blood groups to search for
+            city: City to match, or to rank by when exact_city is False
+            exact_city: Whether to return only donors in city
+            preferred_blood_group: Blood group to rank ahead of the others
+            limit: Maximum number of results
             
-        except Exception as e:
-            logger.error(f"Error searching donors by blood group {blood_group} and city {city}: {e}")
-            raise DonorRepositoryError(f"Failed to search donors: {str(e)}")
+        Returns:
+            List of matching Donor objects, best match first
+            
+        Raises:
+            DonorRepositoryError: If search fails
+        """
+        params: List[Any] = sorted(blood_groups)
+        group_count = len(params)
+        if exact_city:
+            params.append(city)
+        params.extend((city, preferred_blood_group))
+        if limit is not None:
+            params.append(limit)
+        
+        if not group_count:
+            return []
+        
+        query = _match_sql(group_count, exact_city, limit is not None)
+        return await self._fetch_donors(query, params)
     
+    @_wrap_errors("search donors")
     async def search_by_blood_group(self, blood_group: str) -> List[Donor]:
         """
         Search donors by blood group only.
@@ -286,14 +530,9 @@ class DonorRepository:
         Raises:
             DonorRepositoryError: If search fails
         """
-        try:
-            filters = {'blood_group': blood_group}
-            return await self.get_all(filters)
-            
-        except Exception as e:
-            logger.error(f"Error searching donors by blood group {blood_group}: {e}")
-            raise DonorRepositoryError(f"Failed to search donors: {str(e)}")
+        return await self._fetch_donors(_SQL_BG, (blood_group,))
     
+    @_wrap_errors("search donors")
     async def search_by_city(self, city: str) -> List[Donor]:
         """
         Search donors by city only.
@@ -307,14 +546,9 @@ class DonorRepository:
         Raises:
             DonorRepositoryError: If search fails
         """
-        try:
-            filters = {'city': city}
-            return await self.get_all(filters)
-            
-        except Exception as e:
-            logger.error(f"Error searching donors by city {city}: {e}")
-            raise DonorRepositoryError(f"Failed to search donors: {str(e)}")
+        return await self._fetch_donors(_SQL_CITY, (city,))
     
+    @_wrap_errors("count donors")
     async def count_donors(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count total number of donors with optional filtering.
@@ -328,32 +562,190 @@ class DonorRepository:
         Raises:
             DonorRepositoryError: If count fails
         """
+        filters = filters or {}
+        blood_group = filters.get('blood_group')
+        city = filters.get('city')
+        
+        # City counts are answered from the NOCASE city indexes; the
+        # others come from the trigger-maintained donor_counts table
+        if city and blood_group:
+            query, params = _SQL_COUNT_BG_CITY, (city, blood_group)
+        elif city:
+            query, params = _SQL_COUNT_CITY, (city,)
+        elif blood_group:
+            query, params = _SQL_COUNT_BG, (blood_group,)
+        else:
+            query, params = _SQL_COUNT_ALL, ()
+        
+        cursor = await self._execute_count(query, params)
+        result = await cursor.fetchone()
+        
+        return result[0] if result else 0
+    
+    @_wrap_errors("count donors")
+    async def count_by_blood_group(self) -> Dict[str, int]:
+        """
+        Count donors per blood group.
+        
+        Returns:
+            Dictionary mapping each blood group to its donor count
+            
+        Raises:
+            DonorRepositoryError: If count fails
+        """
+        cursor = await self._execute_count(_SQL_COUNT_BY_BG)
+        return dict(await cursor.fetchall())
+    
+    @_wrap_errors("count donors")
+    async def count_by_city(self) -> Dict[str, int]:
+        """
+        Count donors per city; cities differing only in case are grouped together.
+        
+        Returns:
+            Dictionary mapping each city to its donor count
+            
+        Raises:
+            DonorRepositoryError: If count fails
+        """
+        connection = await self._get_conn()
+        cursor = await connection.execute(_SQL_COUNT_BY_CITY)
+        return dict(await cursor.fetchall())
+    
+    async def _insert_many(self, donors: List[DonorCreate]) -> List[Donor]:
+        """
+        Insert donor records with one executemany inside one transaction.
+        
+        Args:
+            donors: Non-empty list of DonorCreate objects to insert
+            
+        Returns:
+            List of created Donor objects, in input order
+        """
+        created_at = datetime.now()
+        # Read field values straight from each model's __dict__
+        params = [
+            (f['name'], f['blood_group'], f['city'], f['contact_number'], f['email'], created_at)
+            for f in (d.__dict__ for d in donors)
+        ]
+        
+        async with write_transaction(self.database_path, self._conn) as connection:
+            await connection.executemany(_SQL_INSERT, params)
+            cursor = await connection.execute(_SQL_LAST_ID)
+            (last_id,) = await cursor.fetchone()
+        
+        # Rows inserted by one executemany inside one transaction get
+        # consecutive ids ending at last_insert_rowid()
+        first_id = last_id - len(donors) + 1
+        
+        return [
+            Donor(
+                id=first_id + i,
+                name=d.name,
+                blood_group=d.blood_group,
+                city=d.city,
+                contact_number=d.contact_number,
+                email=d.email,
+                created_at=created_at
+            )
+            for i, d in enumerate(donors)
+        ]
+    
+    def _build_select(self, filters: Optional[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+        """
+        Pick the donor SELECT and parameters for the given filters.
+        
+        Args:
+            filters: Optional dictionary with the same criteria as get_all
+            
+        Returns:
+            Tuple of (SQL string, list of parameters)
+        """
+        filters = filters or {}
+        blood_group = filters.get('blood_group')
+        city = filters.get('city')
+        cursor = filters.get('cursor')
+        
+        params = [value for value in (blood_group, city) if value]
+        
+        # Keyset pagination: seek past the previous page via the
+        # created_at index instead of skipping rows with OFFSET
+        if cursor is None:
+            cursor_sql = ""
+        elif isinstance(cursor, int):
+            # The last donor's created_at is looked up by primary key
+            cursor_sql = _CURSOR_ID_SQL
+            params.extend((cursor, cursor))
+        else:
+            cursor_sql = _CURSOR_VALUES_SQL
+            params.extend(cursor)
+        
+        query = _select_sql(bool(blood_group), bool(city), cursor_sql)
+        
+        # Add pagination if specified
+        if 'limit' in filters:
+            query += " LIMIT ?"
+            params.append(filters['limit'])
+            
+            if 'offset' in filters:
+                query += " OFFSET ?"
+                params.append(filters['offset'])
+        
+        return query, params
+    
+    async def _fetch_donors(self, query: str, params: Sequence[Any]) -> List[Donor]:
+        """
+        Run a donor SELECT and map every row to a Donor.
+        
+        Args:
+            query: SQL selecting the donor columns in table order
+            params: Query parameters
+            
+        Returns:
+            List of Donor objects
+        """
+        connection = await self._get_conn()
+        cursor = await connection.execute(query, params)
+        
+        donors = []
+        while True:
+            rows = await cursor.fetchmany(_FETCH_BATCH)
+            if not rows:
+                break
+            donors.extend(_rows_to_donors(rows))
+        
+        return donors
+    
+    async def _execute_count(self, query: str, params: Sequence[Any] = ()) -> aiosqlite.Cursor:
+        """
+        Run a count query, counting the donors table directly if donor_counts is missing.
+        
+        Args:
+            query: Count SQL, possibly reading the donor_counts table
+            params: Query parameters
+            
+        Returns:
+            Cursor over the count results
+        """
+        connection = await self._get_conn()
         try:
-            async with get_db_session(self.database_path) as connection:
-                query = "SELECT COUNT(*) FROM donors"
-                params = []
-                where_conditions = []
-                
-                if filters:
-                    if 'blood_group' in filters and filters['blood_group']:
-                        where_conditions.append("blood_group = ?")
-                        params.append(filters['blood_group'])
-                    
-                    if 'city' in filters and filters['city']:
-                        where_conditions.append("LOWER(city) = LOWER(?)")
-                        params.append(filters['city'])
-                
-                if where_conditions:
-                    query += " WHERE " + " AND ".join(where_conditions)
-                
-                cursor = await connection.execute(query, params)
-                result = await cursor.fetchone()
-                
-                return result[0] if result else 0
-                
-        except Exception as e:
-            logger.error(f"Error counting donors: {e}")
-            raise DonorRepositoryError(f"Failed to count donors: {str(e)}")
+            return await connection.execute(query, params)
+        except sqlite3.OperationalError as e:
+            fallback = _DONOR_COUNTS_FALLBACK.get(query)
+            if fallback is None or "no such table" not in str(e):
+                raise
+            logger.warning("donor_counts table missing; counting donors directly")
+            return await connection.execute(fallback, params)
+    
+    async def _get_conn(self) -> aiosqlite.Connection:
+        """
+        Get the connection this repository runs its queries on.
+        
+        Returns:
+            The injected connection, or the shared connection for database_path
+        """
+        if self._conn is not None:
+            return self._conn
+        return await get_pool(self.database_path)
     
     def _row_to_donor(self, row: tuple) -> Donor:
         """
@@ -365,12 +757,4 @@ class DonorRepository:
         Returns:
             Donor object
         """
-        return Donor(
-            id=row[0],
-            name=row[1],
-            blood_group=row[2],
-            city=row[3],
-            contact_number=row[4],
-            email=row[5],
-            created_at=datetime.fromisoformat(row[6]) if row[6] else None
-        )
\ No newline at end of file
+        return _rows_to_donors((row,))[0]
\ No newline at end of file
@@ -1,18 +1,68 @@
-from typing import List, Optional, Dict, Any
+import functools
+from typing import Any, AsyncIterator, Dict, Final, List, Optional, Tuple
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from models.blood_request import BloodRequest, BloodRequestCreate, BloodRequestUpdate
 from repositories.blood_request_repository import BloodRequestRepository, BloodRequestRepositoryError
+from .cache import async_cached, invalidate
 
 logger = logging.getLogger(__name__)
 
+# Cache namespace for blood request reads, cleared by every write below
+_CACHE_NAMESPACE = "blood_requests"
+
+# Seconds a cached statistics/critical/active result stays valid
+_CACHE_TTL = 30
+
+# Accepted filter values, shared by validation and statistics
+VALID_BLOOD_GROUPS: Final[frozenset] = frozenset({'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'})
+VALID_URGENCY_LEVELS: Final[frozenset] = frozenset({'Low', 'Medium', 'High', 'Critical'})
+VALID_STATUSES: Final[frozenset] = frozenset({'Active', 'Fulfilled'})
+
+_INVALID_BLOOD_GROUP_MSG: Final[str] = (
+    f"Invalid blood group. Must be one of: {', '.join(sorted(VALID_BLOOD_GROUPS))}"
+)
+_INVALID_URGENCY_MSG: Final[str] = (
+    f"Invalid urgency level. Must be one of: {', '.join(sorted(VALID_URGENCY_LEVELS))}"
+)
+_INVALID_STATUS_MSG: Final[str] = (
+    f"Invalid status. Must be one of: {', '.join(sorted(VALID_STATUSES))}"
+)
+
 
 class BloodRequestServiceError(Exception):
     """Custom exception for blood request service operations."""
     pass
 
 
+def _wrap_repo_errors(operation: str):
+    """
+    Translate failures inside a service method into BloodRequestServiceError.
+    
+    Service errors pass through unchanged; repository and unexpected errors
+    are logged and re-raised with the operation in the message.
+    
+    Args:
+        operation: Description used in the "Failed to ..." message
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except BloodRequestServiceError:
+                raise
+            except BloodRequestRepositoryError as e:
+                logger.error("Repository error in %s: %s", fn.__name__, e)
+                raise BloodRequestServiceError(f"Failed to {operation}: {str(e)}") from e
+            except Exception as e:
+                logger.error("Unexpected error in %s: %s", fn.__name__, e)
+                raise BloodRequestServiceError(f"Unexpected error: {str(e)}") from e
+        return wrapper
+    return decorator
+
+
 class BloodRequestService:
     """Service class for blood request business logic and operations."""
     
@@ -25,6 +75,7 @@ class BloodRequestService:
         """
         self.blood_request_repository = blood_request_repository or BloodRequestRepository()
     
+    @_wrap_repo_errors("create blood request")
     async def create_blood_request(self, request_data: BloodRequestCreate) -> BloodRequest:
         """
         Create a new blood request with business logic validation.
@@ -38,23 +89,17 @@ class BloodRequestService:
         Raises:
             BloodRequestServiceError: If creation fails or validation errors occur
         """
-        try:
-            # Additional business logic validation
-            await self._validate_blood_request_creation(request_data)
-            
-            # Create the blood request
-            blood_request = await self.blood_request_repository.create(request_data)
-            
-            logger.info(f"Successfully created blood request with ID: {blood_request.id}")
-            return blood_request
-            
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error creating blood request: {e}")
-            raise BloodRequestServiceError(f"Failed to create blood request: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error creating blood request: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+        # Additional business logic validation
+        self._validate_blood_request_creation(request_data)
+        
+        # Create the blood request
+        blood_request = await self.blood_request_repository.create(request_data)
+        invalidate(_CACHE_NAMESPACE)
+        
+        logger.info("Successfully created blood request with ID: %s", blood_request.id)
+        return blood_request
     
+    @_wrap_repo_errors("retrieve blood request")
     async def get_blood_request_by_id(self, request_id: int) -> Optional[BloodRequest]:
         """
         Retrieve a blood request by ID with business logic.
@@ -68,26 +113,19 @@ class BloodRequestService:
         Raises:
             BloodRequestServiceError: If retrieval fails
         """
-        try:
-            if request_id <= 0:
-                raise BloodRequestServiceError("Blood request ID must be a positive integer")
-            
-            blood_request = await self.blood_request_repository.get_by_id(request_id)
-            
-            if blood_request:
-                logger.debug(f"Retrieved blood request with ID: {request_id}")
-            else:
-                logger.debug(f"Blood request with ID {request_id} not found")
-            
-            return blood_request
-            
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error retrieving blood request {request_id}: {e}")
-            raise BloodRequestServiceError(f"Failed to retrieve blood request: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving blood request {request_id}: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+        if request_id <= 0:
+            raise BloodRequestServiceError("Blood request ID must be a positive integer")
+        
+        blood_request = await self.blood_request_repository.get_by_id(request_id)
+        
+        if blood_request:
+            logger.debug("Retrieved blood request with ID: %s", request_id)
+        else:
+            logger.debug("Blood request with ID %s not found", request_id)
+        
+        return blood_request
     
+    @_wrap_repo_errors("retrieve blood requests")
     async def get_all_blood_requests(
         self,
         blood_group: Optional[str] = None,
@@ -95,81 +133,85 @@ class BloodRequestService:
         urgency: Optional[str] = None,
         status: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        cursor: Optional[int] = None
     ) -> List[BloodRequest]:
         """
         Retrieve all blood requests with filtering and pagination.
         
+        For the next page, pass the ID of the last request returned as
+        cursor; unlike offset, its cost does not grow with page depth.
+        
         Args:
             blood_group: Filter by blood group
             city: Filter by city
             urgency: Filter by urgency level
             status: Filter by status
             limit: Maximum number of results
-            offset: Number of results to skip
+            offset: Number of results to skip (deprecated, use cursor)
+            cursor: ID of the last request on the previous page
             
         Returns:
-            List of BloodRequest objects
+            List of BloodRequest objects, newest first
             
         Raises:
             BloodRequestServiceError: If retrieval fails
         """
-        try:
-            # Build filters
-            filters = {}
-            
-            if blood_group:
-                # Validate blood group format
-                valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-                if blood_group not in valid_blood_groups:
-                    raise BloodRequestServiceError(
-                        f"Invalid blood group. Must be one of: {', '.join(valid_blood_groups)}"
-                    )
-                filters['blood_group'] = blood_group
-            
-            if city:
-                filters['city'] = city.strip()
-            
-            if urgency:
-                # Validate urgency level
-                valid_urgency_levels = {'Low', 'Medium', 'High', 'Critical'}
-                if urgency not in valid_urgency_levels:
-                    raise BloodRequestServiceError(
-                        f"Invalid urgency level. Must be one of: {', '.join(valid_urgency_levels)}"
-                    )
-                filters['urgency'] = urgency
-            
-            if status:
-                # Validate status
-                valid_statuses = {'Active', 'Fulfilled'}
-                if status not in valid_statuses:
-                    raise BloodRequestServiceError(
-                        f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-                    )
-                filters['status'] = status
-            
-            if limit is not None:
-                if limit <= 0:
-                    raise BloodRequestServiceError("Limit must be a positive integer")
-                filters['limit'] = limit
-            
-            if offset is not None:
-                if offset < 0:
-                    raise BloodRequestServiceError("Offset must be non-negative")
-                filters['offset'] = offset
-            
-            blood_requests = await self.blood_request_repository.get_all(filters)
+        filters = self._build_filters(blood_group, city, urgency, status)
+        
+        if limit is not None:
+            if limit <= 0:
+                raise BloodRequestServiceError("Limit must be a positive integer")
+            filters['limit'] = limit
+        
+        if offset is not None:
+            if offset < 0:
+                raise BloodRequestServiceError("Offset must be non-negative")
+            filters['offset'] = offset
+        
+        if cursor is not None:
+            if cursor <= 0:
+                raise BloodRequestServiceError("Cursor must be a positive integer")
+            filters['cursor'] = cursor
+        
+        blood_requests = await self.blood_request_repository.get_all(filters)
+        
+        logger.debug("Retrieved %s blood requests with filters: %s", len(blood_requests), filters)
+        return blood_requests
+    
+    async def iter_blood_requests(
+        self,
+        blood_group: Optional[str] = None,
+        city: Optional[str] = None,
+        urgency: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> AsyncIterator[BloodRequest]:
+        """
+        Stream blood requests with optional filtering.
+        
+        Args:
+            blood_group: Filter by blood group
+            city: Filter by city
+            urgency: Filter by urgency level
+            status: Filter by status
             
-            logger.debug(f"Retrieved {len(blood_requests)} blood requests with filters: {filters}")
-            return blood_requests
+        Yields:
+            BloodRequest objects, newest first
             
+        Raises:
+            BloodRequestServiceError: If retrieval fails
+        """
+        filters = self._build_filters(blood_group, city, urgency, status)
+        
+        try:
+            async for blood_request in self.blood_request_repository.iter_all(filters):
+                yield blood_request
+                
         except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error retrieving blood requests: {e}")
+            logger.error("Repository error streaming blood requests: %s", e)
             raise BloodRequestServiceError(f"Failed to retrieve blood requests: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving blood requests: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
     
+    @_wrap_repo_errors("update blood request")
     async def update_blood_request(
         self, 
         request_id: int, 
@@ -188,33 +230,34 @@ class BloodRequestService:
         Raises:
             BloodRequestServiceError: If update fails or validation errors occur
         """
-        try:
-            if request_id <= 0:
-                raise BloodRequestServiceError("Blood request ID must be a positive integer")
-            
-            # Check if blood request exists
+        if request_id <= 0:
+            raise BloodRequestServiceError("Blood request ID must be a positive integer")
+        
+        # Additional business logic validation
+        self._validate_blood_request_update(request_update)
+        
+        # Update the blood request; the existence and reactivation
+        # checks happen in the same statement
+        updated_request = await self.blood_request_repository.update(request_id, request_update)
+        
+        if updated_request is None:
+            # Only look the row up to explain why nothing was updated
             existing_request = await self.blood_request_repository.get_by_id(request_id)
-            if not existing_request:
-                return None
-            
-            # Additional business logic validation
-            await self._validate_blood_request_update(request_update, existing_request)
-            
-            # Update the blood request
-            updated_request = await self.blood_request_repository.update(request_id, request_update)
-            
-            if updated_request:
-                logger.info(f"Successfully updated blood request with ID: {request_id}")
-            
-            return updated_request
-            
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error updating blood request {request_id}: {e}")
-            raise BloodRequestServiceError(f"Failed to update blood request: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error updating blood request {request_id}: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+            if (existing_request and existing_request.status == "Fulfilled" and
+                    request_update.status == "Active"):
+                raise BloodRequestServiceError("Cannot reactivate a fulfilled blood request")
+            return None
+        
+        invalidate(_CACHE_NAMESPACE)
+        
+        # Business rule: Critical requests should have hospital name
+        if updated_request.urgency == "Critical" and not updated_request.hospital_name:
+            logger.warning("Critical blood request updated without hospital name for request ID: %s", request_id)
+        
+        logger.info("Successfully updated blood request with ID: %s", request_id)
+        return updated_request
     
+    @_wrap_repo_errors("delete blood request")
     async def delete_blood_request(self, request_id: int) -> bool:
         """
         Delete a blood request with business logic checks.
@@ -228,55 +271,100 @@ class BloodRequestService:
         Raises:
             BloodRequestServiceError: If deletion fails
         """
-        try:
-            if request_id <= 0:
-                raise BloodRequestServiceError("Blood request ID must be a positive integer")
-            
-            # Check if blood request exists before deletion
-            existing_request = await self.blood_request_repository.get_by_id(request_id)
-            if not existing_request:
-                return False
-            
-            # Additional business logic checks could go here
-            # (e.g., prevent deletion of fulfilled requests, etc.)
+        if request_id <= 0:
+            raise BloodRequestServiceError("Blood request ID must be a positive integer")
+        
+        # Additional business logic checks could go here
+        # (e.g., prevent deletion of fulfilled requests, etc.)
+        
+        # Returns False when the request does not exist
+        success = await self.blood_request_repository.delete(request_id)
+        if success:
+            invalidate(_CACHE_NAMESPACE)
+            logger.info("Successfully deleted blood request with ID: %s", request_id)
+        
+        return success
+    
+    @_wrap_repo_errors("fulfill blood requests")
+    async def bulk_fulfill_blood_requests(self, request_ids: List[int]) -> List[int]:
+        """
+        Mark several blood requests as fulfilled at once.
+        
+        Args:
+            request_ids: IDs of the blood requests to fulfill
             
-            success = await self.blood_request_repository.delete(request_id)
+        Returns:
+            Sorted IDs of the requests that were fulfilled; missing and
+            already fulfilled requests are skipped
             
-            if success:
-                logger.info(f"Successfully deleted blood request with ID: {request_id}")
+        Raises:
+            BloodRequestServiceError: If fulfillment fails or an ID is invalid
+        """
+        self._validate_request_ids(request_ids)
+        
+        fulfilled_ids = await self.blood_request_repository.bulk_fulfill(request_ids)
+        if fulfilled_ids:
+            invalidate(_CACHE_NAMESPACE)
+        
+        logger.info("Fulfilled %s of %s blood requests", len(fulfilled_ids), len(request_ids))
+        return fulfilled_ids
+    
+    @_wrap_repo_errors("delete blood requests")
+    async def bulk_delete_blood_requests(self, request_ids: List[int]) -> List[int]:
+        """
+        Delete several blood requests at once.
+        
+        Args:
+            request_ids: IDs of the blood requests to delete
             
-            return success
+        Returns:
+            Sorted IDs of the requests that were deleted; missing requests
+            are skipped
             
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error deleting blood request {request_id}: {e}")
-            raise BloodRequestServiceError(f"Failed to delete blood request: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error deleting blood request {request_id}: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+        Raises:
+            BloodRequestServiceError: If deletion fails or an ID is invalid
+        """
+        self._validate_request_ids(request_ids)
+        
+        deleted_ids = await self.blood_request_repository.bulk_delete(request_ids)
+        if deleted_ids:
+            invalidate(_CACHE_NAMESPACE)
+        
+        logger.info("Deleted %s of %s blood requests", len(deleted_ids), len(request_ids))
+        return deleted_ids
     
-    async def get_active_blood_requests(self) -> List[BloodRequest]:
+    @_wrap_repo_errors("retrieve active blood requests")
+    async def get_active_blood_requests(self, limit: Optional[int] = None, offset: int = 0) -> List[BloodRequest]:
         """
-        Retrieve all active blood requests.
+        Retrieve active blood requests, newest first.
+        
+        Pages with a limit are cached; the unbounded listing always reads
+        from the database.
         
+        Args:
+            limit: Maximum number of results, or None for every active request
+            offset: Number of results to skip
+            
         Returns:
             List of active BloodRequest objects
             
         Raises:
             BloodRequestServiceError: If retrieval fails
         """
-        try:
-            active_requests = await self.blood_request_repository.get_active_requests()
-            
-            logger.debug(f"Retrieved {len(active_requests)} active blood requests")
-            return active_requests
-            
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error retrieving active blood requests: {e}")
-            raise BloodRequestServiceError(f"Failed to retrieve active blood requests: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving active blood requests: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+        if limit is None:
+            active_requests = await self.blood_request_repository.get_active_requests(None, offset)
+        else:
+            active_requests = list(await self._get_active_page(limit, offset))
+        
+        logger.debug("Retrieved %s active blood requests", len(active_requests))
+        return active_requests
+    
+    @async_cached(_CACHE_TTL, _CACHE_NAMESPACE)
+    async def _get_active_page(self, limit: int, offset: int) -> Tuple[BloodRequest, ...]:
+        """Read one page of active blood requests as a tuple for the cache."""
+        return tuple(await self.blood_request_repository.get_active_requests(limit, offset))
     
+    @_wrap_repo_errors("retrieve blood requests")
     async def get_blood_requests_by_urgency(self, urgency: str) -> List[BloodRequest]:
         """
         Retrieve blood requests by urgency level with validation.
@@ -290,26 +378,16 @@ class BloodRequestService:
         Raises:
             BloodRequestServiceError: If retrieval fails or validation errors occur
         """
-        try:
-            # Validate urgency level
-            valid_urgency_levels = {'Low', 'Medium', 'High', 'Critical'}
-            if urgency not in valid_urgency_levels:
-                raise BloodRequestServiceError(
-                    f"Invalid urgency level. Must be one of: {', '.join(valid_urgency_levels)}"
-                )
-            
-            requests = await self.blood_request_repository.get_requests_by_urgency(urgency)
-            
-            logger.debug(f"Retrieved {len(requests)} blood requests with urgency: {urgency}")
-            return requests
-            
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error retrieving blood requests by urgency {urgency}: {e}")
-            raise BloodRequestServiceError(f"Failed to retrieve blood requests: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving blood requests by urgency {urgency}: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+        # Validate urgency level
+        if urgency not in VALID_URGENCY_LEVELS:
+            raise BloodRequestServiceError(_INVALID_URGENCY_MSG)
+        
+        requests = await self.blood_request_repository.get_requests_by_urgency(urgency)
+        
+        logger.debug("Retrieved %s blood requests with urgency: %s", len(requests), urgency)
+        return requests
     
+    @_wrap_repo_errors("fulfill blood request")
     async def fulfill_blood_request(self, request_id: int) -> Optional[BloodRequest]:
         """
         Mark a blood request as fulfilled with business logic validation.
@@ -323,97 +401,80 @@ class BloodRequestService:
         Raises:
             BloodRequestServiceError: If fulfillment fails or validation errors occur
         """
-        try:
-            if request_id <= 0:
-                raise BloodRequestServiceError("Blood request ID must be a positive integer")
-            
-            # Check if blood request exists and is active
+        if request_id <= 0:
+            raise BloodRequestServiceError("Blood request ID must be a positive integer")
+        
+        # Fulfill the request; only matches if it exists and is active
+        fulfilled_request = await self.blood_request_repository.fulfill_request(request_id)
+        
+        if fulfilled_request is None:
+            # Only look the row up to explain why nothing was updated
             existing_request = await self.blood_request_repository.get_by_id(request_id)
-            if not existing_request:
-                return None
-            
-            if existing_request.status == "Fulfilled":
+            if existing_request and existing_request.status == "Fulfilled":
                 raise BloodRequestServiceError("Blood request is already fulfilled")
-            
-            # Fulfill the request
-            fulfilled_request = await self.blood_request_repository.fulfill_request(request_id)
-            
-            if fulfilled_request:
-                logger.info(f"Successfully fulfilled blood request with ID: {request_id}")
-            
-            return fulfilled_request
-            
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error fulfilling blood request {request_id}: {e}")
-            raise BloodRequestServiceError(f"Failed to fulfill blood request: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error fulfilling blood request {request_id}: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+            return None
+        
+        invalidate(_CACHE_NAMESPACE)
+        
+        logger.info("Successfully fulfilled blood request with ID: %s", request_id)
+        return fulfilled_request
     
+    @_wrap_repo_errors("generate statistics")
     async def get_blood_request_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about blood requests in the system.
         
+        The underlying counts are cached; last_updated is the UTC time they
+        were read.
+        
         Returns:
             Dictionary with blood request statistics
             
         Raises:
             BloodRequestServiceError: If statistics retrieval fails
         """
-        try:
-            # Get total count
-            total_requests = await self.blood_request_repository.count_requests()
-            
-            # Get count by status
-            active_count = await self.blood_request_repository.count_requests({'status': 'Active'})
-            fulfilled_count = await self.blood_request_repository.count_requests({'status': 'Fulfilled'})
-            
-            # Get count by urgency
-            urgency_stats = {}
-            valid_urgency_levels = {'Low', 'Medium', 'High', 'Critical'}
-            
-            for urgency in valid_urgency_levels:
-                count = await self.blood_request_repository.count_requests({'urgency': urgency})
-                urgency_stats[urgency] = count
-            
-            # Get count by blood group
-            blood_group_stats = {}
-            valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-            
-            for blood_group in valid_blood_groups:
-                count = await self.blood_request_repository.count_requests({'blood_group': blood_group})
-                blood_group_stats[blood_group] = count
-            
-            # Get all requests to calculate city statistics
-            all_requests = await self.blood_request_repository.get_all()
-            city_stats = {}
-            
-            for request in all_requests:
-                city = request.city
-                city_stats[city] = city_stats.get(city, 0) + 1
-            
-            statistics = {
-                'total_requests': total_requests,
-                'status_distribution': {
-                    'Active': active_count,
-                    'Fulfilled': fulfilled_count
-                },
-                'urgency_distribution': urgency_stats,
-                'blood_group_distribution': blood_group_stats,
-                'city_distribution': city_stats,
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            logger.debug("Generated blood request statistics")
-            return statistics
-            
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error generating blood request statistics: {e}")
-            raise BloodRequestServiceError(f"Failed to generate statistics: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error generating blood request statistics: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+        counts, last_updated = await self._get_distribution()
+        distribution = {name: dict(items) for name, items in counts}
+        status_stats = distribution['status']
+        
+        # Report every known urgency level and blood group, even at zero
+        urgency_stats = {
+            urgency: distribution['urgency'].get(urgency, 0)
+            for urgency in VALID_URGENCY_LEVELS
+        }
+        blood_group_stats = {
+            blood_group: distribution['blood_group'].get(blood_group, 0)
+            for blood_group in VALID_BLOOD_GROUPS
+        }
+        
+        statistics = {
+            'total_requests': sum(blood_group_stats.values()),
+            'status_distribution': {
+                status: status_stats.get(status, 0) for status in VALID_STATUSES
+            },
+            'urgency_distribution': urgency_stats,
+            'blood_group_distribution': blood_group_stats,
+            'city_distribution': distribution['city'],
+            'last_updated': last_updated
+        }
+        
+        logger.debug("Generated blood request statistics")
+        return statistics
     
+    @async_cached(_CACHE_TTL, _CACHE_NAMESPACE)
+    async def _get_distribution(self) -> Tuple[tuple, str]:
+        """
+        Read the request counts per status, urgency, blood group and city.
+        
+        Returns:
+            Tuple of ((distribution name, (value, count) pairs) entries, UTC
+            time the counts were read), immutable so it can be cached
+        """
+        distribution = await self.blood_request_repository.get_distribution_stats()
+        counts = tuple((name, tuple(stats.items())) for name, stats in distribution.items())
+        return counts, datetime.now(timezone.utc).isoformat()
+    
+    @_wrap_repo_errors("retrieve critical blood requests")
     async def get_critical_blood_requests(self) -> List[BloodRequest]:
         """
         Retrieve all critical blood requests (active requests with Critical urgency).
@@ -424,25 +485,59 @@ class BloodRequestService:
         Raises:
             BloodRequestServiceError: If retrieval fails
         """
-        try:
-            filters = {
-                'urgency': 'Critical',
-                'status': 'Active'
-            }
-            
-            critical_requests = await self.blood_request_repository.get_all(filters)
-            
-            logger.debug(f"Retrieved {len(critical_requests)} critical blood requests")
-            return critical_requests
-            
-        except BloodRequestRepositoryError as e:
-            logger.error(f"Repository error retrieving critical blood requests: {e}")
-            raise BloodRequestServiceError(f"Failed to retrieve critical blood requests: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving critical blood requests: {e}")
-            raise BloodRequestServiceError(f"Unexpected error: {str(e)}")
+        critical_requests = list(await self._get_critical_requests())
+        
+        logger.debug("Retrieved %s critical blood requests", len(critical_requests))
+        return critical_requests
+    
+    @async_cached(_CACHE_TTL, _CACHE_NAMESPACE)
+    async def _get_critical_requests(self) -> Tuple[BloodRequest, ...]:
+        """Read the active Critical requests as a tuple for the cache."""
+        filters = {
+            'urgency': 'Critical',
+            'status': 'Active'
+        }
+        return tuple(await self.blood_request_repository.get_all(filters))
     
-    async def _validate_blood_request_creation(self, request_data: BloodRequestCreate) -> None:
+    def _build_filters(
+        self,
+        blood_group: Optional[str],
+        city: Optional[str],
+        urgency: Optional[str],
+        status: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Validate listing filters and build the repository filter dictionary.
+        
+        Raises:
+            BloodRequestServiceError: If a filter value is invalid
+        """
+        filters = {}
+        
+        if blood_group:
+            # Validate blood group format
+            if blood_group not in VALID_BLOOD_GROUPS:
+                raise BloodRequestServiceError(_INVALID_BLOOD_GROUP_MSG)
+            filters['blood_group'] = blood_group
+        
+        if city:
+            filters['city'] = city.strip()
+        
+        if urgency:
+            # Validate urgency level
+            if urgency not in VALID_URGENCY_LEVELS:
+                raise BloodRequestServiceError(_INVALID_URGENCY_MSG)
+            filters['urgency'] = urgency
+        
+        if status:
+            # Validate status
+            if status not in VALID_STATUSES:
+                raise BloodRequestServiceError(_INVALID_STATUS_MSG)
+            filters['status'] = status
+        
+        return filters
+    
+    def _validate_blood_request_creation(self, request_data: BloodRequestCreate) -> None:
         """
         Additional business logic validation for blood request creation.
         
@@ -464,19 +559,30 @@ class BloodRequestService:
         
         # Business rule: Critical requests should have hospital name
         if request_data.urgency == "Critical" and not request_data.hospital_name:
-            logger.warning(f"Critical blood request created without hospital name for patient: {request_data.patient_name}")
+            logger.warning("Critical blood request created without hospital name for patient: %s", request_data.patient_name)
     
-    async def _validate_blood_request_update(
-        self, 
-        request_update: BloodRequestUpdate, 
-        existing_request: BloodRequest
-    ) -> None:
+    def _validate_request_ids(self, request_ids: List[int]) -> None:
+        """
+        Check that every ID in a bulk operation is a positive integer.
+        
+        Args:
+            request_ids: IDs of blood requests
+            
+        Raises:
+            BloodRequestServiceError: If validation fails
+        """
+        if request_ids and min(request_ids) <= 0:
+            raise BloodRequestServiceError("Blood request IDs must be positive integers")
+    
+    def _validate_blood_request_update(self, request_update: BloodRequestUpdate) -> None:
         """
         Additional business logic validation for blood request updates.
         
+        Rules that depend on the stored request (no reactivating a fulfilled
+        request) are enforced by the repository's UPDATE statement.
+        
         Args:
             request_update: BloodRequestUpdate object to validate
-            existing_request: Current blood request data
             
         Raises:
             BloodRequestServiceError: If validation fails
@@ -489,16 +595,4 @@ class BloodRequestService:
         
         # Validate patient name is not empty if being updated
         if request_update.patient_name is not None and not request_update.patient_name.strip():
-            raise BloodRequestServiceError("Patient name cannot be empty")
-        
-        # Business rule: Cannot change status from Fulfilled back to Active
-        if (existing_request.status == "Fulfilled" and 
-            request_update.status == "Active"):
-            raise BloodRequestServiceError("Cannot reactivate a fulfilled blood request")
-        
-        # Business rule: Critical requests should have hospital name
-        urgency_to_check = request_update.urgency or existing_request.urgency
-        hospital_to_check = request_update.hospital_name or existing_request.hospital_name
-        
-        if urgency_to_check == "Critical" and not hospital_to_check:
-            logger.warning(f"Critical blood request updated without hospital name for request ID: {existing_request.id}")
\ No newline at end of file
+            raise BloodRequestServiceError("Patient name cannot be empty")
\ No newline at end of file
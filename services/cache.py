@@ -0,0 +1,98 @@
+"""
+In-process TTL cache for read-heavy service methods.
+
+Entries are grouped by namespace. Write paths call invalidate(namespace),
+which bumps that namespace's generation and drops its entries, so results
+computed before a write are never served or stored after it. Every caller
+gets the same cached object, so decorated functions return immutable values
+such as tuples.
+"""
+
+import asyncio
+import functools
+import time
+from typing import Any, Dict, Hashable, Tuple
+
+# Current generation per namespace; bumped by invalidate()
+_generations: Dict[str, int] = {}
+
+# (namespace, call key) -> (expiry on the monotonic clock, value)
+_entries: Dict[Tuple[str, Hashable], Tuple[float, Any]] = {}
+
+# One lock per call key so concurrent misses compute the value only once
+_locks: Dict[Tuple[str, Hashable], asyncio.Lock] = {}
+
+# Seconds between sweeps that drop expired entries and their idle locks
+_SWEEP_INTERVAL = 60.0
+
+# Monotonic time of the next sweep
+_next_sweep = 0.0
+
+
+def _sweep(now: float) -> None:
+    """
+    Drop expired entries and every lock that is not currently held.
+    
+    Args:
+        now: Current time on the monotonic clock
+    """
+    global _next_sweep
+    _next_sweep = now + _SWEEP_INTERVAL
+    for key in [key for key, entry in _entries.items() if entry[0] <= now]:
+        del _entries[key]
+    for key in [key for key, lock in _locks.items() if not lock.locked()]:
+        del _locks[key]
+
+
+def async_cached(ttl_seconds: float, namespace: str):
+    """
+    Cache the result of a coroutine function for ttl_seconds.
+    
+    Calls are keyed by function, positional arguments (including self) and
+    keyword arguments, which must all be hashable. Exceptions are not cached.
+    
+    Args:
+        ttl_seconds: How long a result stays valid
+        namespace: Group invalidated together by invalidate()
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            key = (namespace, (fn.__qualname__, args, frozenset(kwargs.items())))
+            
+            now = time.monotonic()
+            if now >= _next_sweep:
+                _sweep(now)
+            
+            entry = _entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            
+            async with _locks.setdefault(key, asyncio.Lock()):
+                # Another caller may have filled the entry while we waited
+                entry = _entries.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+                
+                generation = _generations.get(namespace, 0)
+                value = await fn(*args, **kwargs)
+                if _generations.get(namespace, 0) == generation:
+                    _entries[key] = (time.monotonic() + ttl_seconds, value)
+                return value
+        
+        return wrapper
+    return decorator
+
+
+def invalidate(namespace: str) -> None:
+    """
+    Drop every cached result in a namespace.
+    
+    Args:
+        namespace: Namespace passed to async_cached
+    """
+    _generations[namespace] = _generations.get(namespace, 0) + 1
+    for key in [key for key in _entries if key[0] == namespace]:
+        del _entries[key]
+    for key in [key for key, lock in _locks.items() if key[0] == namespace and not lock.locked()]:
+        del _locks[key]
\ No newline at end of file
@@ -1,18 +1,66 @@
-from typing import List, Optional, Dict, Any
+import asyncio
+import functools
+from typing import AsyncIterator, List, Optional, Dict, Any, Final, Tuple
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 
 from models.donor import Donor, DonorCreate, DonorUpdate
 from repositories.donor_repository import DonorRepository, DonorRepositoryError
+from .cache import async_cached, invalidate
 
 logger = logging.getLogger(__name__)
 
+# Cache namespace for donor statistics, cleared by every write below
+_CACHE_NAMESPACE = "donors"
+
+# Seconds cached donor statistics stay valid
+_CACHE_TTL = 30
+
+# Accepted blood groups, shared by validation and statistics
+VALID_BLOOD_GROUPS: Final[frozenset] = frozenset({'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'})
+
+_INVALID_BLOOD_GROUP_MSG: Final[str] = (
+    f"Invalid blood group. Must be one of: {', '.join(sorted(VALID_BLOOD_GROUPS))}"
+)
+
+# Pagination bounds; rows skipped by OFFSET are still read, so deep pages
+# must use the cursor instead
+MAX_LIMIT: Final[int] = 500
+MAX_OFFSET: Final[int] = 10_000
+
 
 class DonorServiceError(Exception):
     """Custom exception for donor service operations."""
     pass
 
 
+def _wrap_repo_errors(operation: str):
+    """
+    Translate failures inside a service method into DonorServiceError.
+    
+    Service errors pass through unchanged; repository and unexpected errors
+    are logged and re-raised with the operation in the message.
+    
+    Args:
+        operation: Description used in the "Failed to ..." message
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await fn(*args, **kwargs)
+            except DonorServiceError:
+                raise
+            except DonorRepositoryError as e:
+                logger.error("Repository error in %s: %s", fn.__name__, e)
+                raise DonorServiceError(f"Failed to {operation}: {str(e)}") from e
+            except Exception as e:
+                logger.error("Unexpected error in %s: %s", fn.__name__, e)
+                raise DonorServiceError(f"Unexpected error: {str(e)}") from e
+        return wrapper
+    return decorator
+
+
 class DonorService:
     """Service class for donor business logic and operations."""
     
@@ -25,6 +73,7 @@ class DonorService:
         """
         self.donor_repository = donor_repository or DonorRepository()
     
+    @_wrap_repo_errors("create donor")
     async def create_donor(self, donor_data: DonorCreate) -> Donor:
         """
         Create a new donor with business logic validation.
@@ -38,33 +87,59 @@ class DonorService:
         Raises:
             DonorServiceError: If creation fails or validation errors occur
         """
-        try:
-            # Additional business logic validation
-            await self._validate_donor_creation(donor_data)
+        # Additional business logic validation
+        self._validate_donor_creation(donor_data)
+        
+        # Check for duplicate donors (same contact number)
+        if await self.donor_repository.exists_by_contact_number(donor_data.contact_number):
+            raise DonorServiceError(
+                f"Donor with contact number {donor_data.contact_number} already exists"
+            )
+        
+        # Create the donor
+        donor = await self.donor_repository.create(donor_data)
+        invalidate(_CACHE_NAMESPACE)
+        
+        logger.info("Successfully created donor with ID: %s", donor.id)
+        return donor
+    
+    @_wrap_repo_errors("create donors")
+    async def create_donors(self, donors_data: List[DonorCreate]) -> List[Donor]:
+        """
+        Create several donors at once with business logic validation.
+        
+        Args:
+            donors_data: List of DonorCreate objects
             
-            # Check for duplicate donors (same contact number)
-            existing_donors = await self.donor_repository.get_all({
-                'contact_number': donor_data.contact_number
-            })
+        Returns:
+            List of created Donor objects, in input order
             
-            if existing_donors:
+        Raises:
+            DonorServiceError: If creation fails or validation errors occur
+        """
+        seen_numbers = set()
+        for donor_data in donors_data:
+            self._validate_donor_creation(donor_data)
+            
+            if donor_data.contact_number in seen_numbers:
                 raise DonorServiceError(
-                    f"Donor with contact number {donor_data.contact_number} already exists"
+                    f"Contact number {donor_data.contact_number} appears more than once"
                 )
-            
-            # Create the donor
-            donor = await self.donor_repository.create(donor_data)
-            
-            logger.info(f"Successfully created donor with ID: {donor.id}")
-            return donor
-            
-        except DonorRepositoryError as e:
-            logger.error(f"Repository error creating donor: {e}")
-            raise DonorServiceError(f"Failed to create donor: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error creating donor: {e}")
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
+            seen_numbers.add(donor_data.contact_number)
+        
+        existing_number = await self.donor_repository.find_existing_contact_number(seen_numbers)
+        if existing_number is not None:
+            raise DonorServiceError(
+                f"Donor with contact number {existing_number} already exists"
+            )
+        
+        donors = await self.donor_repository.create_many(donors_data)
+        invalidate(_CACHE_NAMESPACE)
+        
+        logger.info("Successfully created %s donors", len(donors))
+        return donors
     
+    @_wrap_repo_errors("retrieve donor")
     async def get_donor_by_id(self, donor_id: int) -> Optional[Donor]:
         """
         Retrieve a donor by ID with business logic.
@@ -78,86 +153,120 @@ class DonorService:
         Raises:
             DonorServiceError: If retrieval fails
         """
-        try:
-            if donor_id <= 0:
-                raise DonorServiceError("Donor ID must be a positive integer")
-            
-            donor = await self.donor_repository.get_by_id(donor_id)
-            
-            if donor:
-                logger.debug(f"Retrieved donor with ID: {donor_id}")
-            else:
-                logger.debug(f"Donor with ID {donor_id} not found")
-            
-            return donor
-            
-        except DonorRepositoryError as e:
-            logger.error(f"Repository error retrieving donor {donor_id}: {e}")
-            raise DonorServiceError(f"Failed to retrieve donor: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving donor {donor_id}: {e}")
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
+        if donor_id <= 0:
+            raise DonorServiceError("Donor ID must be a positive integer")
+        
+        donor = await self.donor_repository.get_by_id(donor_id)
+        
+        if donor:
+            logger.debug("Retrieved donor with ID: %s", donor_id)
+        else:
+            logger.debug("Donor with ID %s not found", donor_id)
+        
+        return donor
     
+    @_wrap_repo_errors("retrieve donors")
     async def get_all_donors(
         self, 
         blood_group: Optional[str] = None,
         city: Optional[str] = None,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
+        offset: Optional[int] = None,
+        cursor: Optional[int] = None
     ) -> List[Donor]:
         """
         Retrieve all donors with filtering and pagination.
         
+        For the next page, pass the ID of the last donor returned as
+        cursor; unlike offset, its cost does not grow with page depth.
+        
         Args:
             blood_group: Filter by blood group
             city: Filter by city
-            limit: Maximum number of results
-            offset: Number of results to skip
+            limit: Maximum number of results, at most MAX_LIMIT
+            offset: Number of results to skip, at most MAX_OFFSET (deprecated, use cursor)
+            cursor: ID of the last donor on the previous page
             
         Returns:
-            List of Donor objects
+            List of Donor objects, newest first
             
         Raises:
             DonorServiceError: If retrieval fails
         """
-        try:
-            # Build filters
-            filters = {}
-            
-            if blood_group:
-                # Validate blood group format
-                valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-                if blood_group not in valid_blood_groups:
-                    raise DonorServiceError(
-                        f"Invalid blood group. Must be one of: {', '.join(valid_blood_groups)}"
-                    )
-                filters['blood_group'] = blood_group
-            
-            if city:
-                filters['city'] = city.strip()
-            
-            if limit is not None:
-                if limit <= 0:
-                    raise DonorServiceError("Limit must be a positive integer")
-                filters['limit'] = limit
-            
-            if offset is not None:
-                if offset < 0:
-                    raise DonorServiceError("Offset must be non-negative")
-                filters['offset'] = offset
-            
-            donors = await self.donor_repository.get_all(filters)
+        # Build filters
+        filters = {}
+        
+        if blood_group:
+            self._validate_blood_group(blood_group)
+            filters['blood_group'] = blood_group
+        
+        if city:
+            filters['city'] = city.strip()
+        
+        if limit is not None:
+            if limit <= 0:
+                raise DonorServiceError("Limit must be a positive integer")
+            if limit > MAX_LIMIT:
+                raise DonorServiceError(f"Limit must not exceed {MAX_LIMIT}")
+            filters['limit'] = limit
+        
+        if offset is not None:
+            if offset < 0:
+                raise DonorServiceError("Offset must be non-negative")
+            if offset > MAX_OFFSET:
+                raise DonorServiceError(
+                    f"Offset must not exceed {MAX_OFFSET}; use cursor pagination for deeper pages"
+                )
+            filters['offset'] = offset
+        
+        if cursor is not None:
+            if cursor <= 0:
+                raise DonorServiceError("Cursor must be a positive integer")
+            filters['cursor'] = cursor
+        
+        donors = await self.donor_repository.get_all(filters)
+        
+        logger.debug("Retrieved %s donors with filters: %s", len(donors), filters)
+        return donors
+    
+    async def iter_donors(
+        self,
+        blood_group: Optional[str] = None,
+        city: Optional[str] = None,
+        chunk_size: int = 500
+    ) -> AsyncIterator[List[Donor]]:
+        """
+        Stream donors in chunks with optional filtering.
+        
+        Args:
+            blood_group: Filter by blood group
+            city: Filter by city
+            chunk_size: Number of donors per yielded list
             
-            logger.debug(f"Retrieved {len(donors)} donors with filters: {filters}")
-            return donors
+        Yields:
+            Lists of Donor objects, newest first
             
+        Raises:
+            DonorServiceError: If retrieval fails
+        """
+        filters = {}
+        
+        if blood_group:
+            self._validate_blood_group(blood_group)
+            filters['blood_group'] = blood_group
+        
+        if city:
+            filters['city'] = city.strip()
+        
+        try:
+            async for chunk in self.donor_repository.iter_all(filters, chunk_size):
+                yield chunk
+                
         except DonorRepositoryError as e:
-            logger.error(f"Repository error retrieving donors: {e}")
+            logger.error("Repository error streaming donors: %s", e)
             raise DonorServiceError(f"Failed to retrieve donors: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving donors: {e}")
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
     
+    @_wrap_repo_errors("update donor")
     async def update_donor(self, donor_id: int, donor_update: DonorUpdate) -> Optional[Donor]:
         """
         Update an existing donor with business logic validation.
@@ -172,43 +281,34 @@ class DonorService:
         Raises:
             DonorServiceError: If update fails or validation errors occur
         """
-        try:
-            if donor_id <= 0:
-                raise DonorServiceError("Donor ID must be a positive integer")
-            
-            # Check if donor exists
-            existing_donor = await self.donor_repository.get_by_id(donor_id)
-            if not existing_donor:
-                return None
-            
-            # Additional business logic validation
-            await self._validate_donor_update(donor_update, existing_donor)
-            
-            # Check for duplicate contact number if being updated
-            if donor_update.contact_number:
-                existing_donors = await self.donor_repository.get_all()
-                for donor in existing_donors:
-                    if (donor.contact_number == donor_update.contact_number and 
-                        donor.id != donor_id):
-                        raise DonorServiceError(
-                            f"Another donor with contact number {donor_update.contact_number} already exists"
-                        )
-            
-            # Update the donor
-            updated_donor = await self.donor_repository.update(donor_id, donor_update)
-            
-            if updated_donor:
-                logger.info(f"Successfully updated donor with ID: {donor_id}")
-            
-            return updated_donor
-            
-        except DonorRepositoryError as e:
-            logger.error(f"Repository error updating donor {donor_id}: {e}")
-            raise DonorServiceError(f"Failed to update donor: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error updating donor {donor_id}: {e}")
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
+        if donor_id <= 0:
+            raise DonorServiceError("Donor ID must be a positive integer")
+        
+        # Check if donor exists; a primary key probe, the row is not loaded
+        if not await self.donor_repository.exists_by_id(donor_id):
+            return None
+        
+        # Additional business logic validation
+        self._validate_donor_update(donor_update)
+        
+        # Check for duplicate contact number if being updated
+        if donor_update.contact_number and await self.donor_repository.exists_by_contact_number(
+            donor_update.contact_number, exclude_id=donor_id
+        ):
+            raise DonorServiceError(
+                f"Another donor with contact number {donor_update.contact_number} already exists"
+            )
+        
+        # Update the donor
+        updated_donor = await self.donor_repository.update(donor_id, donor_update)
+        
+        if updated_donor:
+            invalidate(_CACHE_NAMESPACE)
+            logger.info("Successfully updated donor with ID: %s", donor_id)
+        
+        return updated_donor
     
+    @_wrap_repo_errors("delete donor")
     async def delete_donor(self, donor_id: int) -> bool:
         """
         Delete a donor with business logic checks.
@@ -222,32 +322,22 @@ class DonorService:
         Raises:
             DonorServiceError: If deletion fails
         """
-        try:
-            if donor_id <= 0:
-                raise DonorServiceError("Donor ID must be a positive integer")
-            
-            # Check if donor exists before deletion
-            existing_donor = await self.donor_repository.get_by_id(donor_id)
-            if not existing_donor:
-                return False
-            
-            # Additional business logic checks could go here
-            # (e.g., check if donor has pending donations, etc.)
-            
-            success = await self.donor_repository.delete(donor_id)
-            
-            if success:
-                logger.info(f"Successfully deleted donor with ID: {donor_id}")
-            
-            return success
-            
-        except DonorRepositoryError as e:
-            logger.error(f"Repository error deleting donor {donor_id}: {e}")
-            raise DonorServiceError(f"Failed to delete donor: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error deleting donor {donor_id}: {e}")
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
+        if donor_id <= 0:
+            raise DonorServiceError("Donor ID must be a positive integer")
+        
+        # Additional business logic checks could go here
+        # (e.g., check if donor has pending donations, etc.)
+        
+        # A missing donor shows up as no deleted row, so no lookup is needed first
+        success = await self.donor_repository.delete(donor_id)
+        
+        if success:
+            invalidate(_CACHE_NAMESPACE)
+            logger.info("Successfully deleted donor with ID: %s", donor_id)
+        
+        return success
     
+    @_wrap_repo_errors("search donors")
     async def search_donors_by_blood_group(self, blood_group: str) -> List[Donor]:
         """
         Search donors by blood group with validation.
@@ -261,26 +351,14 @@ class DonorService:
         Raises:
             DonorServiceError: If search fails or validation errors occur
         """
-        try:
-            # Validate blood group format
-            valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-            if blood_group not in valid_blood_groups:
-                raise DonorServiceError(
-                    f"Invalid blood group. Must be one of: {', '.join(valid_blood_groups)}"
-                )
-            
-            donors = await self.donor_repository.search_by_blood_group(blood_group)
-            
-            logger.debug(f"Found {len(donors)} donors with blood group: {blood_group}")
-            return donors
-            
-        except DonorRepositoryError as e:
-            logger.error(f"Repository error searching donors by blood group {blood_group}: {e}")
-            raise DonorServiceError(f"Failed to search donors: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error searching donors by blood group {blood_group}: {e}")
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
+        self._validate_blood_group(blood_group)
+        
+        donors = await self.donor_repository.search_by_blood_group(blood_group)
+        
+        logger.debug("Found %s donors with blood group: %s", len(donors), blood_group)
+        return donors
     
+    @_wrap_repo_errors("search donors")
     async def search_donors_by_city(self, city: str) -> List[Donor]:
         """
         Search donors by city with validation.
@@ -294,22 +372,15 @@ class DonorService:
         Raises:
             DonorServiceError: If search fails or validation errors occur
         """
-        try:
-            if not city or not city.strip():
-                raise DonorServiceError("City cannot be empty")
-            
-            donors = await self.donor_repository.search_by_city(city.strip())
-            
-            logger.debug(f"Found {len(donors)} donors in city: {city}")
-            return donors
-            
-        except DonorRepositoryError as e:
-            logger.error(f"Repository error searching donors by city {city}: {e}")
-            raise DonorServiceError(f"Failed to search donors: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error searching donors by city {city}: {e}")
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
+        if not city or not city.strip():
+            raise DonorServiceError("City cannot be empty")
+        
+        donors = await self.donor_repository.search_by_city(city.strip())
+        
+        logger.debug("Found %s donors in city: %s", len(donors), city)
+        return donors
     
+    @_wrap_repo_errors("search donors")
     async def search_donors_by_blood_group_and_city(
         self, 
         blood_group: str, 
@@ -328,85 +399,81 @@ class DonorService:
         Raises:
             DonorServiceError: If search fails or validation errors occur
         """
-        try:
-            # Validate blood group format
-            valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-            if blood_group not in valid_blood_groups:
-                raise DonorServiceError(
-                    f"Invalid blood group. Must be one of: {', '.join(valid_blood_groups)}"
-                )
-            
-            if not city or not city.strip():
-                raise DonorServiceError("City cannot be empty")
-            
-            donors = await self.donor_repository.search_by_blood_group_and_city(
-                blood_group, city.strip()
-            )
-            
-            logger.debug(
-                f"Found {len(donors)} donors with blood group {blood_group} in city: {city}"
-            )
-            return donors
-            
-        except DonorRepositoryError as e:
-            logger.error(
-                f"Repository error searching donors by blood group {blood_group} and city {city}: {e}"
-            )
-            raise DonorServiceError(f"Failed to search donors: {str(e)}")
-        except Exception as e:
-            logger.error(
-                f"Unexpected error searching donors by blood group {blood_group} and city {city}: {e}"
-            )
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
+        self._validate_blood_group(blood_group)
+        
+        if not city or not city.strip():
+            raise DonorServiceError("City cannot be empty")
+        
+        donors = await self.donor_repository.search_by_blood_group_and_city(
+            blood_group, city.strip()
+        )
+        
+        logger.debug(
+            "Found %s donors with blood group %s in city: %s", len(donors), blood_group, city
+        )
+        return donors
     
+    @_wrap_repo_errors("generate statistics")
     async def get_donor_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about donors in the system.
         
+        The underlying counts are cached; last_updated is the UTC time they
+        were read.
+        
         Returns:
             Dictionary with donor statistics
             
         Raises:
             DonorServiceError: If statistics retrieval fails
         """
-        try:
-            # Get total count
-            total_donors = await self.donor_repository.count_donors()
-            
-            # Get count by blood group
-            blood_group_stats = {}
-            valid_blood_groups = {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}
-            
-            for blood_group in valid_blood_groups:
-                count = await self.donor_repository.count_donors({'blood_group': blood_group})
-                blood_group_stats[blood_group] = count
-            
-            # Get all donors to calculate city statistics
-            all_donors = await self.donor_repository.get_all()
-            city_stats = {}
-            
-            for donor in all_donors:
-                city = donor.city
-                city_stats[city] = city_stats.get(city, 0) + 1
-            
-            statistics = {
-                'total_donors': total_donors,
-                'blood_group_distribution': blood_group_stats,
-                'city_distribution': city_stats,
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            logger.debug("Generated donor statistics")
-            return statistics
+        blood_group_counts, city_counts, last_updated = await self._get_counts()
+        
+        # Count by blood group, with every blood group present
+        counts = dict(blood_group_counts)
+        blood_group_stats = {bg: counts.get(bg, 0) for bg in VALID_BLOOD_GROUPS}
+        total_donors = sum(blood_group_stats.values())
+        
+        statistics = {
+            'total_donors': total_donors,
+            'blood_group_distribution': blood_group_stats,
+            'city_distribution': dict(city_counts),
+            'last_updated': last_updated
+        }
+        
+        logger.debug("Generated donor statistics")
+        return statistics
+    
+    @async_cached(_CACHE_TTL, _CACHE_NAMESPACE)
+    async def _get_counts(self) -> Tuple[tuple, tuple, str]:
+        """
+        Read donor counts per blood group and per city.
+        
+        Returns:
+            Tuple of ((blood group, count) pairs, (city, count) pairs, UTC
+            time the counts were read), immutable so it can be cached
+        """
+        # Run both aggregates concurrently
+        counts, city_stats = await asyncio.gather(
+            self.donor_repository.count_by_blood_group(),
+            self.donor_repository.count_by_city()
+        )
+        return tuple(counts.items()), tuple(city_stats.items()), datetime.now(timezone.utc).isoformat()
+    
+    def _validate_blood_group(self, blood_group: str) -> None:
+        """
+        Check that a blood group is one of the accepted values.
+        
+        Args:
+            blood_group: Blood group to validate
             
-        except DonorRepositoryError as e:
-            logger.error(f"Repository error generating donor statistics: {e}")
-            raise DonorServiceError(f"Failed to generate statistics: {str(e)}")
-        except Exception as e:
-            logger.error(f"Unexpected error generating donor statistics: {e}")
-            raise DonorServiceError(f"Unexpected error: {str(e)}")
+        Raises:
+            DonorServiceError: If the blood group is not recognised
+        """
+        if blood_group not in VALID_BLOOD_GROUPS:
+            raise DonorServiceError(_INVALID_BLOOD_GROUP_MSG)
     
-    async def _validate_donor_creation(self, donor_data: DonorCreate) -> None:
+    def _validate_donor_creation(self, donor_data: DonorCreate) -> None:
         """
         Additional business logic validation for donor creation.
         
@@ -427,17 +494,12 @@ class DonorService:
         if not donor_data.name.strip():
             raise DonorServiceError("Name cannot be empty")
     
-    async def _validate_donor_update(
-        self, 
-        donor_update: DonorUpdate, 
-        existing_donor: Donor
-    ) -> None:
+    def _validate_donor_update(self, donor_update: DonorUpdate) -> None:
         """
         Additional business logic validation for donor updates.
         
         Args:
             donor_update: DonorUpdate object to validate
-            existing_donor: Current donor data
             
         Raises:
             DonorServiceError: If validation fails
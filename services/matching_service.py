@@ -1,6 +1,10 @@
-from typing import List, Optional, Dict, Any, Set
+import asyncio
+import heapq
+from collections import Counter
+from typing import ClassVar, Final, FrozenSet, List, Optional, Dict, Any, Sequence, Tuple
 import logging
-from datetime import datetime
+from operator import itemgetter
+from datetime import datetime, timezone
 
 from models.donor import Donor
 from models.blood_request import BloodRequest
@@ -9,15 +13,127 @@ from repositories.blood_request_repository import BloodRequestRepository, BloodR
 
 logger = logging.getLogger(__name__)
 
+# Compatible donor groups for an unknown recipient group
+_NO_GROUPS: Final[FrozenSet[str]] = frozenset()
+
+# Match score bonus per request urgency
+_URGENCY_BONUS: Final[Dict[str, float]] = {
+    'Critical': 10.0,
+    'High': 7.0,
+    'Medium': 4.0,
+    'Low': 1.0
+}
+
+# Sort priority per request urgency (higher number = higher priority)
+_URGENCY_PRIORITY: Final[Dict[str, int]] = {
+    'Critical': 4,
+    'High': 3,
+    'Medium': 2,
+    'Low': 1
+}
+
+# Sort key for (urgency priority, match score, request) ranking tuples
+_RANK_KEY = itemgetter(0, 1)
+
 
 class MatchingServiceError(Exception):
     """Custom exception for matching service operations."""
     pass
 
 
+def _invert_compatibility(compatibility_map: Dict[str, FrozenSet[str]]) -> Dict[str, FrozenSet[str]]:
+    """
+    Invert a recipient -> donor groups mapping.
+    
+    Args:
+        compatibility_map: Mapping of recipient blood groups to compatible donor blood groups
+        
+    Returns:
+        Dictionary mapping donor blood groups to the recipient blood groups they can serve
+    """
+    return {
+        donor_group: frozenset(
+            recipient for recipient, donors in compatibility_map.items()
+            if donor_group in donors
+        )
+        for donor_group in compatibility_map
+    }
+
+
+def _partial_scores(
+    required_group: str,
+    compatible_groups: FrozenSet[str],
+    urgency_bonus: float,
+    compatibility_map: Dict[str, FrozenSet[str]]
+) -> Dict[str, float]:
+    """
+    Calculate the match score, before the city match, of each donor blood group.
+    
+    Args:
+        required_group: Blood group of the request
+        compatible_groups: Donor blood groups compatible with required_group
+        urgency_bonus: Bonus for the request's urgency
+        compatibility_map: Mapping whose keys are every known blood group
+        
+    Returns:
+        Dictionary mapping donor blood groups to partial match scores
+    """
+    return {
+        donor_group: (
+            urgency_bonus
+            # Base compatibility score (40 points)
+            + (40.0 if donor_group in compatible_groups else 0.0)
+            # Exact blood group match bonus (20 points)
+            + (20.0 if donor_group == required_group else 0.0)
+        )
+        for donor_group in compatibility_map
+    }
+
+
+def _build_score_table(
+    compatibility_map: Dict[str, FrozenSet[str]]
+) -> Dict[Tuple[str, str], Dict[str, float]]:
+    """
+    Precompute partial match scores for every request blood group and urgency.
+    
+    Args:
+        compatibility_map: Mapping of recipient blood groups to compatible donor blood groups
+        
+    Returns:
+        Dictionary mapping (request blood group, urgency) to _partial_scores results
+    """
+    return {
+        (required_group, urgency): _partial_scores(
+            required_group, compatible_groups, urgency_bonus, compatibility_map
+        )
+        for required_group, compatible_groups in compatibility_map.items()
+        for urgency, urgency_bonus in _URGENCY_BONUS.items()
+    }
+
+
 class MatchingService:
     """Service class for donor-request matching logic and operations."""
     
+    __slots__ = ('donor_repository', 'blood_request_repository')
+    
+    # Blood group compatibility mapping, shared by every instance
+    _compatibility_map: ClassVar[Dict[str, FrozenSet[str]]] = {
+        'A+': frozenset({'A+', 'A-', 'O+', 'O-'}),
+        'A-': frozenset({'A-', 'O-'}),
+        'B+': frozenset({'B+', 'B-', 'O+', 'O-'}),
+        'B-': frozenset({'B-', 'O-'}),
+        'AB+': frozenset({'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'}),  # Universal recipient
+        'AB-': frozenset({'A-', 'B-', 'AB-', 'O-'}),
+        'O+': frozenset({'O+', 'O-'}),
+        'O-': frozenset({'O-'})  # Universal donor can only receive from O-
+    }
+    
+    # Inverse mapping: donor blood group -> recipient blood groups it can serve
+    _recipients_of: ClassVar[Dict[str, FrozenSet[str]]] = _invert_compatibility(_compatibility_map)
+    
+    # Match scores before the city match: (request blood group, urgency) -> donor blood group -> score
+    _score_table: ClassVar[Dict[Tuple[str, str], Dict[str, float]]] = _build_score_table(_compatibility_map)
+    
     def __init__(
         self, 
         donor_repository: Optional[DonorRepository] = None,
@@ -32,29 +148,8 @@ class MatchingService:
         """
         self.donor_repository = donor_repository or DonorRepository()
         self.blood_request_repository = blood_request_repository or BloodRequestRepository()
-        
-        # Blood group compatibility mapping
-        self._compatibility_map = self._build_compatibility_map()
-    
-    def _build_compatibility_map(self) -> Dict[str, Set[str]]:
-        """
-        Build blood group compatibility mapping.
-        
-        Returns:
-            Dictionary mapping recipient blood groups to compatible donor blood groups
-        """
-        return {
-            'A+': {'A+', 'A-', 'O+', 'O-'},
-            'A-': {'A-', 'O-'},
-            'B+': {'B+', 'B-', 'O+', 'O-'},
-            'B-': {'B-', 'O-'},
-            'AB+': {'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'},  # Universal recipient
-            'AB-': {'A-', 'B-', 'AB-', 'O-'},
-            'O+': {'O+', 'O-'},
-            'O-': {'O-'}  # Universal donor can only receive from O-
-        }
     
-    def get_compatible_blood_groups(self, recipient_blood_group: str) -> Set[str]:
+    def get_compatible_blood_groups(self, recipient_blood_group: str) -> FrozenSet[str]:
         """
         Get compatible donor blood groups for a recipient.
         
@@ -62,20 +157,15 @@ class MatchingService:
             recipient_blood_group: Blood group of the recipient
             
         Returns:
-            Set of compatible donor blood groups
+            Frozen set of compatible donor blood groups
             
         Raises:
             MatchingServiceError: If blood group is invalid
         """
-        try:
-            if recipient_blood_group not in self._compatibility_map:
-                raise MatchingServiceError(f"Invalid blood group: {recipient_blood_group}")
-            
-            return self._compatibility_map[recipient_blood_group]
-            
-        except Exception as e:
-            logger.error(f"Error getting compatible blood groups for {recipient_blood_group}: {e}")
-            raise MatchingServiceError(f"Failed to get compatible blood groups: {str(e)}")
+        compatible_groups = self._compatibility_map.get(recipient_blood_group)
+        if compatible_groups is None:
+            raise MatchingServiceError(f"Invalid blood group: {recipient_blood_group}")
+        return compatible_groups
     
     def is_blood_compatible(self, donor_blood_group: str, recipient_blood_group: str) -> bool:
         """
@@ -91,13 +181,12 @@ class MatchingService:
         Raises:
             MatchingServiceError: If blood groups are invalid
         """
+        # Called for every donor-request pair, so index the map directly;
+        # the try costs nothing unless the recipient group is unknown
         try:
-            compatible_groups = self.get_compatible_blood_groups(recipient_blood_group)
-            return donor_blood_group in compatible_groups
-            
-        except Exception as e:
-            logger.error(f"Error checking blood compatibility: {e}")
-            raise MatchingServiceError(f"Failed to check blood compatibility: {str(e)}")
+            return donor_blood_group in self._compatibility_map[recipient_blood_group]
+        except KeyError:
+            raise MatchingServiceError(f"Invalid blood group: {recipient_blood_group}") from None
     
     async def find_matching_donors(
         self, 
@@ -123,29 +212,23 @@ class MatchingService:
             # Get compatible blood groups
             compatible_groups = self.get_compatible_blood_groups(blood_request.blood_group)
             
-            # Find donors with compatible blood groups
-            matching_donors = []
-            
-            for blood_group in compatible_groups:
-                if city_exact_match:
-                    # Exact city match
-                    donors = await self.donor_repository.search_by_blood_group_and_city(
-                        blood_group, blood_request.city
-                    )
-                else:
-                    # Just blood group match
-                    donors = await self.donor_repository.search_by_blood_group(blood_group)
-                
-                for donor in donors:
-                    match_info = self._create_match_info(donor, blood_request, city_exact_match)
-                    matching_donors.append(match_info)
-            
-            # Sort by match score (higher is better)
-            matching_donors.sort(key=lambda x: x['match_score'], reverse=True)
-            
-            # Apply limit if specified
-            if limit:
-                matching_donors = matching_donors[:limit]
+            # Find donors with compatible blood groups in one query. The
+            # repository ranks city matches, then exact blood group matches,
+            # first, which is the match score order, so the limit applies in SQL
+            donors = await self.donor_repository.search_by_blood_groups_and_city(
+                compatible_groups,
+                blood_request.city,
+                exact_city=city_exact_match,
+                preferred_blood_group=blood_request.blood_group,
+                limit=limit or None
+            )
+            
+            # Score the whole batch at once so request-side terms are computed once
+            scores = self._calculate_match_scores(donors, blood_request)
+            matching_donors = [
+                self._create_match_info(donor, blood_request, city_exact_match, score)
+                for donor, score in zip(donors, scores)
+            ]
             
             logger.info(
                 f"Found {len(matching_donors)} matching donors for blood request {blood_request.id}"
@@ -226,41 +309,41 @@ class MatchingService:
             MatchingServiceError: If matching fails
         """
         try:
-            # Get all blood requests that this donor can fulfill
-            matching_requests = []
-            
-            # Get requests based on city matching preference
+            # Status, compatibility and city are all filtered in SQL
             if city_exact_match:
-                requests = await self.blood_request_repository.get_requests_by_blood_group_and_city(
-                    donor.blood_group, donor.city
+                requests = await self.blood_request_repository.get_requests_matching_donor(
+                    (donor.blood_group,), city=donor.city, active_only=active_only
                 )
             else:
-                # Get all requests and filter by compatibility
-                all_requests = await self.blood_request_repository.get_all()
-                requests = [
-                    req for req in all_requests 
-                    if self.is_blood_compatible(donor.blood_group, req.blood_group)
-                ]
-            
-            # Filter by status if needed
-            if active_only:
-                requests = [req for req in requests if req.status == "Active"]
-            
-            # Create match information for each request
-            for request in requests:
-                if self.is_blood_compatible(donor.blood_group, request.blood_group):
-                    match_info = self._create_request_match_info(request, donor, city_exact_match)
-                    matching_requests.append(match_info)
-            
-            # Sort by urgency and match score
-            matching_requests.sort(
-                key=lambda x: (x['urgency_priority'], x['match_score']), 
-                reverse=True
+                requests = await self.blood_request_repository.get_requests_matching_donor(
+                    self._recipients_of.get(donor.blood_group, _NO_GROUPS), active_only=active_only
+                )
+            
+            # Rank lightweight (urgency priority, match score, request) tuples
+            # and build the full match info only for the requests returned
+            ranked = (
+                (
+                    self._get_urgency_priority(request.urgency),
+                    self._calculate_match_score(donor, request, city_exact_match),
+                    request
+                )
+                for request in requests
             )
             
-            # Apply limit if specified
+            # Order by urgency and match score; with a limit, the tuples are
+            # streamed through a heap of at most limit entries
             if limit:
-                matching_requests = matching_requests[:limit]
+                ranked = heapq.nlargest(limit, ranked, key=_RANK_KEY)
+            else:
+                ranked = sorted(ranked, key=_RANK_KEY, reverse=True)
+            
+            matching_requests = [
+                self._create_request_match_info(
+                    request, donor, city_exact_match,
+                    match_score=match_score, urgency_priority=urgency_priority
+                )
+                for urgency_priority, match_score, request in ranked
+            ]
             
             logger.info(
                 f"Found {len(matching_requests)} matching requests for donor {donor.id}"
@@ -326,50 +409,52 @@ class MatchingService:
             MatchingServiceError: If statistics generation fails
         """
         try:
-            # Get all active requests and donors
-            active_requests = await self.blood_request_repository.get_active_requests()
-            all_donors = await self.donor_repository.get_all()
+            # Get all active requests and the donor count per blood group;
+            # the two reads are independent
+            active_requests, donor_counts = await asyncio.gather(
+                self.blood_request_repository.get_active_requests(limit=None),
+                self.donor_repository.count_by_blood_group()
+            )
             
             # Calculate matching statistics
             total_active_requests = len(active_requests)
-            total_donors = len(all_donors)
+            total_donors = sum(donor_counts.values())
+            
+            # Potential matches per recipient blood group: every donor of a
+            # compatible group in any city, i.e. what find_matching_donors
+            # returns with city_exact_match=False, without querying per request
+            matches_by_group = {
+                recipient_group: sum(donor_counts.get(bg, 0) for bg in compatible_groups)
+                for recipient_group, compatible_groups in self._compatibility_map.items()
+            }
             
-            # Count requests with potential matches
+            # Count requests with potential matches, overall and per urgency,
+            # in a single pass
             requests_with_matches = 0
             total_potential_matches = 0
+            urgency_stats = {
+                urgency: {'total_requests': 0, 'requests_with_matches': 0}
+                for urgency in ('Critical', 'High', 'Medium', 'Low')
+            }
             
             for request in active_requests:
-                matches = await self.find_matching_donors(request, city_exact_match=False)
+                matches = matches_by_group.get(request.blood_group, 0)
+                urgency_bucket = urgency_stats[request.urgency]
+                urgency_bucket['total_requests'] += 1
                 if matches:
                     requests_with_matches += 1
-                    total_potential_matches += len(matches)
+                    total_potential_matches += matches
+                    urgency_bucket['requests_with_matches'] += 1
             
             # Calculate statistics by blood group
-            blood_group_stats = {}
-            for blood_group in self._compatibility_map.keys():
-                request_count = len([r for r in active_requests if r.blood_group == blood_group])
-                donor_count = len([d for d in all_donors if d.blood_group == blood_group])
-                
-                blood_group_stats[blood_group] = {
-                    'active_requests': request_count,
-                    'available_donors': donor_count
-                }
-            
-            # Calculate urgency statistics
-            urgency_stats = {}
-            for urgency in ['Critical', 'High', 'Medium', 'Low']:
-                urgent_requests = [r for r in active_requests if r.urgency == urgency]
-                requests_with_matches_count = 0
-                
-                for request in urgent_requests:
-                    matches = await self.find_matching_donors(request, city_exact_match=False)
-                    if matches:
-                        requests_with_matches_count += 1
-                
-                urgency_stats[urgency] = {
-                    'total_requests': len(urgent_requests),
-                    'requests_with_matches': requests_with_matches_count
+            request_counts = Counter(request.blood_group for request in active_requests)
+            blood_group_stats = {
+                blood_group: {
+                    'active_requests': request_counts[blood_group],
+                    'available_donors': donor_counts.get(blood_group, 0)
                 }
+                for blood_group in self._compatibility_map
+            }
             
             statistics = {
                 'total_active_requests': total_active_requests,
@@ -379,7 +464,7 @@ class MatchingService:
                 'match_rate': (requests_with_matches / total_active_requests * 100) if total_active_requests > 0 else 0,
                 'blood_group_breakdown': blood_group_stats,
                 'urgency_breakdown': urgency_stats,
-                'last_updated': datetime.now().isoformat()
+                'last_updated': datetime.now(timezone.utc).isoformat()
             }
             
             logger.debug("Generated matching statistics")
@@ -396,7 +481,8 @@ class MatchingService:
         self, 
         donor: Donor, 
         blood_request: BloodRequest, 
-        city_exact_match: bool
+        city_exact_match: bool,
+        match_score: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Create match information dictionary for a donor-request pair.
@@ -405,12 +491,14 @@ class MatchingService:
             donor: Donor object
             blood_request: BloodRequest object
             city_exact_match: Whether city matching was used
+            match_score: Precomputed match score (calculated if None)
             
         Returns:
             Dictionary with match information
         """
         # Calculate match score
-        match_score = self._calculate_match_score(donor, blood_request, city_exact_match)
+        if match_score is None:
+            match_score = self._calculate_match_score(donor, blood_request, city_exact_match)
         
         return {
             'donor': {
@@ -423,7 +511,7 @@ class MatchingService:
             },
             'match_score': match_score,
             'blood_compatible': self.is_blood_compatible(donor.blood_group, blood_request.blood_group),
-            'city_match': donor.city.lower() == blood_request.city.lower(),
+            'city_match': donor.city_key == blood_request.city_key,
             'exact_blood_match': donor.blood_group == blood_request.blood_group,
             'match_details': {
                 'donor_blood_group': donor.blood_group,
@@ -438,7 +526,9 @@ class MatchingService:
         self, 
         blood_request: BloodRequest, 
         donor: Donor, 
-        city_exact_match: bool
+        city_exact_match: bool,
+        match_score: Optional[float] = None,
+        urgency_priority: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Create match information dictionary for a request-donor pair.
@@ -447,15 +537,19 @@ class MatchingService:
             blood_request: BloodRequest object
             donor: Donor object
             city_exact_match: Whether city matching was used
+            match_score: Precomputed match score (calculated if None)
+            urgency_priority: Precomputed urgency priority (calculated if None)
             
         Returns:
             Dictionary with match information
         """
         # Calculate match score
-        match_score = self._calculate_match_score(donor, blood_request, city_exact_match)
+        if match_score is None:
+            match_score = self._calculate_match_score(donor, blood_request, city_exact_match)
         
         # Calculate urgency priority for sorting
-        urgency_priority = self._get_urgency_priority(blood_request.urgency)
+        if urgency_priority is None:
+            urgency_priority = self._get_urgency_priority(blood_request.urgency)
         
         return {
             'request': {
@@ -471,7 +565,7 @@ class MatchingService:
             'match_score': match_score,
             'urgency_priority': urgency_priority,
             'blood_compatible': self.is_blood_compatible(donor.blood_group, blood_request.blood_group),
-            'city_match': donor.city.lower() == blood_request.city.lower(),
+            'city_match': donor.city_key == blood_request.city_key,
             'exact_blood_match': donor.blood_group == blood_request.blood_group,
             'match_details': {
                 'donor_blood_group': donor.blood_group,
@@ -499,30 +593,52 @@ class MatchingService:
         Returns:
             Match score (0-100, higher is better)
         """
-        score = 0.0
-        
-        # Base compatibility score (40 points)
-        if self.is_blood_compatible(donor.blood_group, blood_request.blood_group):
-            score += 40.0
-        
-        # Exact blood group match bonus (20 points)
-        if donor.blood_group == blood_request.blood_group:
-            score += 20.0
+        return self._calculate_match_scores((donor,), blood_request)[0]
+    
+    def _calculate_match_scores(
+        self,
+        donors: Sequence[Donor],
+        blood_request: BloodRequest
+    ) -> List[float]:
+        """
+        Calculate match scores for many donors against one request.
         
-        # City match score (30 points)
-        if donor.city.lower() == blood_request.city.lower():
-            score += 30.0
+        The request's blood group, city and urgency are resolved once for
+        the whole batch; everything but the city match comes from a table
+        precomputed when the class is defined.
         
+        Args:
+            donors: Donor objects to score
+            blood_request: BloodRequest object
+            
+        Returns:
+            Match scores (0-100, higher is better), in donor order
+        """
+        required_group = blood_request.blood_group
+        required_city = blood_request.city_key
         # Urgency bonus (10 points for critical, 7 for high, 4 for medium, 1 for low)
-        urgency_bonus = {
-            'Critical': 10.0,
-            'High': 7.0,
-            'Medium': 4.0,
-            'Low': 1.0
-        }
-        score += urgency_bonus.get(blood_request.urgency, 0.0)
+        urgency_bonus = _URGENCY_BONUS.get(blood_request.urgency, 0.0)
         
-        return min(score, 100.0)  # Cap at 100
+        # Blood group and urgency points per donor blood group, precomputed
+        # for every valid request; built on the fly only for unknown values
+        partial_scores = self._score_table.get((required_group, blood_request.urgency))
+        if partial_scores is None:
+            partial_scores = _partial_scores(
+                required_group,
+                self._compatibility_map.get(required_group, _NO_GROUPS),
+                urgency_bonus,
+                self._compatibility_map
+            )
+        
+        return [
+            min(
+                partial_scores.get(donor.blood_group, urgency_bonus)
+                # City match score (30 points)
+                + (30.0 if donor.city_key == required_city else 0.0),
+                100.0  # Cap at 100
+            )
+            for donor in donors
+        ]
     
     def _get_urgency_priority(self, urgency: str) -> int:
         """
@@ -534,10 +650,4 @@ class MatchingService:
         Returns:
             Numeric priority value
         """
-        priority_map = {
-            'Critical': 4,
-            'High': 3,
-            'Medium': 2,
-            'Low': 1
-        }
-        return priority_map.get(urgency, 0)
\ No newline at end of file
+        return _URGENCY_PRIORITY.get(urgency, 0)
\ No newline at end of file